@@ -1,76 +1,21 @@
 from __future__ import annotations
 
-import base64
-from pathlib import Path
-
 import streamlit as st
 
-st.set_page_config(page_title="About • Portfolio JRR", page_icon="🛰️", layout="wide")
-
-ROOT = Path(__file__).resolve().parents[1]  # /portfolio-jrr
-ASSETS = ROOT / "assets"
-LOGO_PATH = ASSETS / "wizard_FN.png"
-
-# =========================
-# ROUTER (navegación robusta)
-# =========================
-GO_TO_PAGE = {
-    "home": "Command_Center.py",
-    "about": "pages/1_About_Me.py",
-    "projects": "pages/2_Projects.py",
-    "lab": "pages/Lab.py",
-    "contact": "pages/3_Contact.py",
-}
-
-go = st.query_params.get("go", None)
-if go in GO_TO_PAGE:
-    st.query_params.clear()
-    st.switch_page(GO_TO_PAGE[go])
-
+from src.brand import logo_img
+from src.theme import inject_theme
 
-@st.cache_data(show_spinner=False)
-def b64_file_cached(path_str: str) -> str:
-    p = Path(path_str)
-    if not p.exists():
-        return ""
-    return base64.b64encode(p.read_bytes()).decode("utf-8")
-
-
-logo_b64 = b64_file_cached(str(LOGO_PATH))
-brand_img = f"<img class='brandlogo' alt='logo' src='data:image/png;base64,{logo_b64}' />" if logo_b64 else ""
+st.set_page_config(page_title="About • Portfolio JRR", page_icon="🛰️", layout="wide")
 
-# --- Minimal UI cleanup (matches Home) ---
-helps = """
-<style>
-header[data-testid="stHeader"] {display:none;}
-footer {visibility:hidden;}
+# Logo: one optimized variant per process, served by URL (src/brand.py)
+brand_img = logo_img("brandlogo")
 
+# --- Shared design system + About-only rules ---
+ABOUT_CSS = """
 /* deja espacio para el header fijo */
 .block-container { padding-top: 6.4rem; padding-bottom: 3rem; max-width: 1080px; }
 
-a { text-decoration: none; }
-</style>
-"""
-st.markdown(helps, unsafe_allow_html=True)
-
-
-# --- Subtle background / typography (antigravity-ish, lightweight) ---
-theme = """
-<style>
-:root{
-  --fg: rgba(255,255,255,.92);
-  --fg2: rgba(255,255,255,.72);
-  --line: rgba(255,255,255,.10);
-  --card: rgba(255,255,255,.04);
-}
-html, body, [data-testid="stAppViewContainer"]{
-  background: radial-gradient(900px 520px at 50% 0%, rgba(255,255,255,.05), rgba(0,0,0,.98)) !important;
-  color: var(--fg) !important;
-}
-h1,h2,h3{ letter-spacing: -0.03em; }
-small, p, li { color: var(--fg2); }
-
-.hr{ height:1px; background: var(--line); margin: 18px 0 26px 0; }
+.hr{ margin: 18px 0 26px 0; }
 
 .chips{ display:flex; gap:10px; flex-wrap: wrap; margin-top: 10px; }
 .chip{
@@ -84,24 +29,9 @@ small, p, li { color: var(--fg2); }
   letter-spacing: .02em;
 }
 
-.card{
-  border: 1px solid var(--line);
-  background: linear-gradient(180deg, var(--card), rgba(0,0,0,.18));
-  border-radius: 18px;
-  padding: 18px 18px;
-}
+.card{ padding: 18px 18px; }
 .card h3{ margin-top: 0; }
 
-.tagwrap{ display:flex; gap:10px; flex-wrap:wrap; }
-.tag{
-  padding: 7px 10px;
-  border-radius: 12px;
-  border: 1px solid var(--line);
-  background: rgba(0,0,0,.18);
-  color: rgba(255,255,255,.78);
-  font-size: 12px;
-}
-
 .kpi{
   display:grid;
   grid-template-columns: repeat(3, minmax(0, 1fr));
@@ -116,7 +46,7 @@ small, p, li { color: var(--fg2); }
 .kpi .k b{ font-size: 18px; color: rgba(255,255,255,.92); }
 .kpi .k span{ display:block; margin-top: 2px; font-size: 12px; color: rgba(255,255,255,.68); }
 
-.cta{ display:flex; gap:10px; flex-wrap:wrap; margin-top: 14px; }
+.cta{ display:flex; gap:10px; flex-wrap:wrap; margin-top: 10px; }
 .cta a{
   display:inline-block;
   padding: 10px 14px;
@@ -127,6 +57,32 @@ small, p, li { color: var(--fg2); }
 }
 .cta a:hover{ background: rgba(255,255,255,.07); }
 
+.cta-main{
+  display:inline-flex;
+  align-items:center;
+  gap:12px;
+  padding: 14px 22px;
+  border-radius: 999px;
+  border: 1px solid var(--line);
+  background: linear-gradient(180deg, rgba(255,255,255,.08), rgba(255,255,255,.02));
+  color: rgba(255,255,255,.92) !important;
+  font-size: 14px;
+  letter-spacing: .2px;
+  transition: all .25s ease;
+}
+.cta-main img{
+  width: 26px;
+  height: 26px;
+  border-radius: 8px;
+  object-fit: cover;
+  box-shadow: 0 8px 22px rgba(0,0,0,.45);
+}
+.cta-main:hover{
+  transform: translateY(-1px);
+  background: linear-gradient(180deg, rgba(255,255,255,.14), rgba(255,255,255,.04));
+  box-shadow: 0 14px 40px rgba(0,0,0,.45);
+}
+
 @media (max-width: 780px){
   .kpi{ grid-template-columns: 1fr; }
 }
@@ -139,25 +95,15 @@ small, p, li { color: var(--fg2); }
   box-shadow: 0 10px 28px rgba(0,0,0,.35);
   border: 1px solid rgba(255,255,255,.10);
 }
-</style>
-"""
-st.markdown(theme, unsafe_allow_html=True)
 
-st.markdown(
-    """
-<style>
+/* header fijo (solo About) */
 .topbar{
   position: fixed;
   top: 0;
   left: 0;
   right: 0;
   z-index: 9999;
-
-  display:flex;
   align-items:center;
-  justify-content:space-between;
-  gap: 12px;
-
   padding: 18px 28px;
   background: rgba(0,0,0,.22);
   backdrop-filter: blur(10px);
@@ -175,25 +121,11 @@ st.markdown(
 }
 .brand a{
   color: rgba(255,255,255,.92) !important;
-  text-decoration:none;
   display:flex;
   align-items:center;
   gap:12px;
 }
 
-.navbtns{ display:flex; gap:10px; flex-wrap:wrap; justify-content:flex-end; }
-.navbtns a{
-  display:inline-block;
-  padding: 9px 12px;
-  border-radius: 999px;
-  border: 1px solid rgba(255,255,255,.10);
-  background: rgba(255,255,255,.04);
-  color: rgba(255,255,255,.88) !important;
-  text-decoration:none;
-  font-size: 13px;
-}
-.navbtns a:hover{ background: rgba(255,255,255,.07); }
-
 .pageTitle{ margin-top: 12px; } /* el contenido ya tiene padding-top */
 .pageTitle h1{ margin:0; }
 .pageTitle .lead{
@@ -201,10 +133,8 @@ st.markdown(
   color: rgba(255,255,255,.70);
   font-size: 13px;
 }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+inject_theme(ABOUT_CSS)
 
 
 # --- Header ---
@@ -426,41 +356,10 @@ st.markdown("""
 
 <div class="cta">
   <a href="./Projects" target="_self" class="cta-main">
-    <img src="data:image/png;base64,{{LOGO_B64}}" alt="logo"/>
+    {{LOGO_IMG}}
     Explore projects
   </a>
 </div>
 
-<style>
-.cta{ margin-top: 10px; }
-
-.cta-main{
-  display:inline-flex;
-  align-items:center;
-  gap:12px;
-  padding: 14px 22px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: linear-gradient(180deg, rgba(255,255,255,.08), rgba(255,255,255,.02));
-  color: rgba(255,255,255,.92) !important;
-  font-size: 14px;
-  letter-spacing: .2px;
-  transition: all .25s ease;
-}
-
-.cta-main img{
-  width: 26px;
-  height: 26px;
-  border-radius: 8px;
-  object-fit: cover;
-  box-shadow: 0 8px 22px rgba(0,0,0,.45);
-}
-
-.cta-main:hover{
-  transform: translateY(-1px);
-  background: linear-gradient(180deg, rgba(255,255,255,.14), rgba(255,255,255,.04));
-  box-shadow: 0 14px 40px rgba(0,0,0,.45);
-}
-</style>
-""".replace("{{LOGO_B64}}", logo_b64), unsafe_allow_html=True)
+""".replace("{{LOGO_IMG}}", logo_img()), unsafe_allow_html=True)
 
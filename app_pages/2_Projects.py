@@ -1,9 +1,10 @@
 from pathlib import Path
 import streamlit as st
-import base64
-import mimetypes
 
-from src.loaders import load_projects
+from src.assets import cover_img_tag
+from src.cached import catalog, search_index
+from src.nav import page_url
+from src.theme import inject_theme
 
 # =========================
 # Page config
@@ -17,75 +18,15 @@ ROOT = Path(__file__).parents[1]  # /portfolio-jrr
 DATA = ROOT / "data" / "projects.yaml"
 
 # =========================
-# Minimal UI cleanup
+# Theme (shared design system + Projects-only rules)
 # =========================
-st.markdown(
-    """
-<style>
-header[data-testid="stHeader"] {display:none;}
-footer {visibility:hidden;}
+PROJECTS_CSS = """
 .block-container { padding-top: 1.6rem; padding-bottom: 3rem; max-width: 1180px; }
-</style>
-""",
-    unsafe_allow_html=True,
-)
 
-# =========================
-# Theme
-# =========================
-st.markdown(
-    """
-<style>
-:root{
-  --fg: rgba(255,255,255,.92);
-  --fg2: rgba(255,255,255,.72);
-  --line: rgba(255,255,255,.10);
-  --card: rgba(255,255,255,.04);
-}
-html, body, [data-testid="stAppViewContainer"]{
-  background: radial-gradient(900px 520px at 50% 0%, rgba(255,255,255,.05), rgba(0,0,0,.98)) !important;
-  color: var(--fg) !important;
-}
-h1,h2,h3{ letter-spacing: -0.03em; }
-.hr{ height:1px; background: var(--line); margin: 14px 0 22px 0; }
-
-.topbar{
-  display:flex; align-items:flex-start; justify-content:space-between;
-  gap: 12px;
-  padding: 10px 0 2px 0;
-}
-.navbtns{ display:flex; gap:10px; flex-wrap:wrap; justify-content:flex-end; }
-.navbtns a{
-  display:inline-block;
-  padding: 9px 12px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(255,255,255,.04);
-  color: rgba(255,255,255,.88) !important;
-  text-decoration:none;
-  font-size: 13px;
-}
-.navbtns a:hover{ background: rgba(255,255,255,.07); }
-
-.card{
-  border: 1px solid var(--line);
-  background: linear-gradient(180deg, var(--card), rgba(0,0,0,.18));
-  border-radius: 18px;
-  padding: 16px 16px;
-}
+.hr{ margin: 14px 0 22px 0; }
+.topbar{ padding: 10px 0 2px 0; }
 
 .meta{ color: rgba(255,255,255,.68); font-size: 12px; margin-top: 4px; }
-.small{ color: rgba(255,255,255,.72); }
-
-.pills{ display:flex; gap:8px; flex-wrap:wrap; margin-top: 10px; }
-.pill{
-  padding: 6px 9px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(0,0,0,.18);
-  color: rgba(255,255,255,.78);
-  font-size: 12px;
-}
 
 .badge{
   display:inline-flex; align-items:center; gap:8px;
@@ -105,20 +46,6 @@ h1,h2,h3{ letter-spacing: -0.03em; }
   box-shadow: 0 0 0 1px rgba(255,255,255,.04), 0 18px 40px rgba(0,0,0,.45);
 }
 
-.links a{
-  display:inline-block;
-  padding: 8px 12px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(255,255,255,.04);
-  color: rgba(255,255,255,.88) !important;
-  text-decoration:none;
-  margin-right: 8px;
-  margin-top: 10px;
-  font-size: 13px;
-}
-.links a:hover{ background: rgba(255,255,255,.07); }
-
 .kv{
   margin-top: 10px;
   display:grid;
@@ -154,11 +81,8 @@ h1,h2,h3{ letter-spacing: -0.03em; }
   border: 1px solid rgba(255,255,255,.10);
   background: rgba(255,255,255,.03);
 }
-
-</style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+inject_theme(PROJECTS_CSS)
 
 # =========================
 # Helpers
@@ -182,7 +106,7 @@ def project_pid(p: dict) -> str:
 
 
 def lab_link(pid: str) -> str:
-    return f"/Lab?project={pid}"
+    return page_url("lab", project=pid)
 
 
 def safe_list(x):
@@ -202,48 +126,17 @@ def render_cover(p: dict):
 
 
 
-def _mime_for(path: Path) -> str:
-    m, _ = mimetypes.guess_type(str(path))
-    return m or "image/png"
-
-def cover_to_img_tag(cover: str, root: Path) -> str:
-    """
-    cover can be:
-      - URL (http/https)
-      - repo-relative path (e.g. assets/covers/x.png)
-      - just filename (e.g. x.png) assumed inside assets/
-    """
-    cover = (cover or "").strip()
-    if not cover:
-        return ""
-
-    # Remote URL
-    if cover.startswith("http://") or cover.startswith("https://"):
-        return f"<img class='cover' src='{cover}' alt='cover'/>"
-
-    # Local paths (try multiple resolutions)
-    candidates = [
-        root / cover,
-        root / "assets" / cover,
-        root / "assets" / "covers" / cover,
-    ]
-    img_path = next((p for p in candidates if p.exists()), None)
-    if not img_path:
-        return ""  # fail silently
-
-    b64 = base64.b64encode(img_path.read_bytes()).decode("utf-8")
-    mime = _mime_for(img_path)
-    return f"<img class='cover' src='data:{mime};base64,{b64}' alt='cover'/>"
-
 # =========================
 # Load projects
 # =========================
-projects = load_projects(DATA)
+projects = catalog(DATA)
+index = search_index(DATA)
 
 # Normalize for UI safety
 norm = []
-for p in projects:
+for p, hay in zip(projects, index["haystack"]):
     p = dict(p or {})
+    p["hay"] = hay
     p["skills"] = safe_list(p.get("skills"))
     p["tools"] = safe_list(p.get("tools"))
     p["outcomes"] = safe_list(p.get("outcomes"))
@@ -280,16 +173,16 @@ st.markdown(
 c1, c2, c3, c4, c5, c6 = st.columns([1.35, 1.05, 1.0, 0.85, 0.9, 0.9], gap="large")
 query = c1.text_input("Search", placeholder="Title, skills, tools, outcomes…")
 
-industry_all = ["All"] + sorted({p.get("industry", "") for p in projects if p.get("industry")})
+industry_all = ["All"] + index["facets"]["industry"]
 industry = c2.selectbox("Industry", industry_all, index=0)
 
-type_all = ["All"] + sorted({p.get("type", "") for p in projects if p.get("type")})
+type_all = ["All"] + index["facets"]["type"]
 ptype = c3.selectbox("Type", type_all, index=0)
 
-status_all = ["All"] + sorted({p.get("status", "") for p in projects if p.get("status")})
+status_all = ["All"] + index["facets"]["status"]
 status = c4.selectbox("Status", status_all, index=0)
 
-impact_all = ["All"] + sorted({p.get("impact_type", "") for p in projects if p.get("impact_type")})
+impact_all = ["All"] + index["facets"]["impact_type"]
 impact_type = c5.selectbox("Impact", impact_all, index=0)
 
 resume_mode = c6.toggle("Resume Mode", value=True)
@@ -310,26 +203,7 @@ def match(p: dict) -> bool:
         return False
 
     if query.strip():
-        q = query.lower().strip()
-        hay = " ".join(
-            [
-                p.get("title", ""),
-                p.get("tagline", ""),
-                p.get("industry", ""),
-                p.get("type", ""),
-                p.get("status", ""),
-                p.get("year", ""),
-                p.get("impact_type", ""),
-                " ".join(p.get("skills", [])),
-                " ".join(p.get("tools", [])),
-                " ".join(p.get("outcomes", [])),
-                p.get("problem", ""),
-                p.get("approach", ""),
-                p.get("results", ""),
-                p.get("details", ""),
-            ]
-        ).lower()
-        return q in hay
+        return query.lower().strip() in p["hay"]
     return True
 
 
@@ -367,7 +241,7 @@ else:
             badge_label = f"✨ Spotlight • {meta}" if (spot and p is spot) else meta
 
             # --- Card ---
-            cover_html = cover_to_img_tag(p.get("cover",""), ROOT)
+            cover_html = cover_img_tag(p.get("cover",""), ROOT)
 
             st.markdown(
                 f"""
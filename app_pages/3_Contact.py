@@ -1,9 +1,12 @@
-import base64
 from pathlib import Path
 from urllib.parse import quote
 
 import streamlit as st
 
+from src.brand import logo_img
+from src.assets import asset_bytes
+from src.theme import inject_theme
+
 
 # =========================
 # PAGE CONFIG
@@ -17,61 +20,20 @@ st.set_page_config(page_title="Contact • Portfolio JRR", page_icon="🛰️",
 ROOT = Path(__file__).parent.parent  # /portfolio-jrr
 ASSETS = ROOT / "assets"
 
-LOGO_PATH = ASSETS / "wizard_FN.png"
 RESUME_PATH = ASSETS / "Jorge_Reyes_CV.pdf"  # asegúrate que exista
 
 
-def b64_file(path: Path) -> str:
-    return base64.b64encode(path.read_bytes()).decode("utf-8") if path.exists() else ""
-
-
-logo_b64 = b64_file(LOGO_PATH)
-resume_b64 = b64_file(RESUME_PATH)
+# CV: memoized bytes, served by st.download_button (a media URL, not inline base64)
+resume_bytes, resume_etag = asset_bytes(RESUME_PATH)
 
 
 # =========================
-# CLEAN UI
+# THEME (shared design system + Contact-only rules)
 # =========================
-st.markdown(
-    """
-<style>
-header[data-testid="stHeader"] {display:none;}
-footer {visibility:hidden;}
+CONTACT_CSS = """
 .block-container { padding-top: 1.6rem; padding-bottom: 3rem; max-width: 1080px; }
-a { text-decoration: none; }
-</style>
-""",
-    unsafe_allow_html=True,
-)
 
-# =========================
-# THEME
-# =========================
-st.markdown(
-    """
-<style>
-:root{
-  --fg: rgba(255,255,255,.92);
-  --fg2: rgba(255,255,255,.72);
-  --line: rgba(255,255,255,.10);
-  --card: rgba(255,255,255,.04);
-}
-
-html, body, [data-testid="stAppViewContainer"]{
-  background: radial-gradient(900px 520px at 50% 0%, rgba(255,255,255,.05), rgba(0,0,0,.98)) !important;
-  color: var(--fg) !important;
-}
-
-h1,h2,h3{ letter-spacing: -0.03em; }
-p, li, small { color: var(--fg2); }
-
-.hr{ height:1px; background: var(--line); margin: 16px 0 22px 0; }
-
-.topbar{
-  display:flex; align-items:flex-start; justify-content:space-between;
-  gap: 12px;
-  padding: 6px 0 2px 0;
-}
+.topbar{ padding: 6px 0 2px 0; }
 
 .brand{
   display:flex; align-items:center; gap:12px;
@@ -87,27 +49,7 @@ p, li, small { color: var(--fg2); }
   box-shadow: 0 10px 28px rgba(0,0,0,.35);
 }
 
-.navbtns{ display:flex; gap:10px; flex-wrap:wrap; justify-content:flex-end; }
-.navbtns a{
-  display:inline-block;
-  padding: 9px 12px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(255,255,255,.04);
-  color: rgba(255,255,255,.88) !important;
-  text-decoration:none;
-  font-size: 13px;
-}
-.navbtns a:hover{ background: rgba(255,255,255,.07); }
-
-.card{
-  border: 1px solid var(--line);
-  background: linear-gradient(180deg, var(--card), rgba(0,0,0,.18));
-  border-radius: 18px;
-  padding: 18px 18px;
-}
-
-.small{ color: rgba(255,255,255,.72); }
+.card{ padding: 18px 18px; }
 
 .action{
   display:flex; gap:12px; flex-wrap:wrap; margin-top: 10px;
@@ -123,15 +65,23 @@ p, li, small { color: var(--fg2); }
 }
 .action a:hover{ background: rgba(255,255,255,.09); }
 
-.tagwrap{ display:flex; gap:10px; flex-wrap:wrap; margin-top:10px; }
-.tag{
-  padding: 7px 10px;
-  border-radius: 12px;
+/* Resume card: a keyed st.container styled like .card (holds the download button) */
+.st-key-resume_card{
   border: 1px solid var(--line);
-  background: rgba(0,0,0,.18);
-  color: rgba(255,255,255,.78);
-  font-size: 12px;
+  background: linear-gradient(180deg, var(--card), rgba(0,0,0,.18));
+  border-radius: 18px;
+  padding: 18px 18px;
 }
+.st-key-resume_card div[data-testid="stDownloadButton"] button{
+  border-radius: 999px;
+  border: 1px solid var(--line);
+  background: rgba(255,255,255,.05);
+  color: rgba(255,255,255,.92);
+  padding: 12px 16px;
+}
+.st-key-resume_card div[data-testid="stDownloadButton"] button:hover{ background: rgba(255,255,255,.09); }
+
+.tagwrap{ margin-top:10px; }
 
 .icon{
   width: 16px; height: 16px; display:inline-block;
@@ -147,10 +97,8 @@ ul.clean li{ margin: 6px 0; }
   .topbar{ flex-direction: column; }
   .navbtns{ justify-content:flex-start; }
 }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+inject_theme(CONTACT_CSS)
 
 
 # =========================
@@ -202,18 +150,17 @@ def svg_icon(kind: str) -> str:
     return icons.get(kind, "")
 
 
-def action_link(href: str, label: str, icon_kind: str, new_tab: bool = True, download: bool = False) -> str:
+def action_link(href: str, label: str, icon_kind: str, new_tab: bool = True) -> str:
     icon = svg_icon(icon_kind)
     icon_html = f"<span class='icon'>{icon}</span>" if icon else ""
     target = "_blank" if new_tab else "_self"
-    dl = "download" if download else ""
-    return f"<a href='{href}' target='{target}' {dl}>{icon_html}{label}</a>"
+    return f"<a href='{href}' target='{target}'>{icon_html}{label}</a>"
 
 
 # =========================
 # HEADER / NAV
 # =========================
-brand_img = f"<img alt='logo' src='data:image/png;base64,{logo_b64}' />" if logo_b64 else ""
+brand_img = logo_img()  # optimized variant served by URL (src/brand.py)
 
 st.markdown(
     f"""
@@ -275,29 +222,34 @@ col1, col2 = st.columns([1.05, 1], gap="large")
 
 with col1:
     # Resume & Profiles
-    resume_link = f"data:application/pdf;base64,{resume_b64}" if resume_b64 else None
-
-    links = []
-    if resume_link:
-        links.append(action_link(resume_link, "Download Resume", "resume", new_tab=False, download=True))
-    else:
-        st.warning("Resume PDF not found. Add it to assets/ as 'Jorge_Reyes_CV.pdf' (or update RESUME_PATH).")
-
-    links.append(action_link("https://www.linkedin.com/in/jorge-reyes-data-science/", "LinkedIn", "linkedin", new_tab=True))
-    links.append(action_link("https://github.com/JorgeRR89", "GitHub", "github", new_tab=True))
-
-    st.markdown(
-        f"""
-<div class="card">
-  <h3 style="margin-top:0;">Resume & Profiles</h3>
-  <p class="small">Fast access for recruiters and collaborators.</p>
-  <div class="action">
-    {''.join(links)}
-  </div>
-</div>
+    with st.container(key="resume_card"):
+        st.markdown(
+            """
+<h3 style="margin-top:0;">Resume & Profiles</h3>
+<p class="small">Fast access for recruiters and collaborators.</p>
 """,
-        unsafe_allow_html=True,
-    )
+            unsafe_allow_html=True,
+        )
+
+        if resume_bytes:
+            # etag in the key: a new CV version gets a fresh widget; clicks don't rerun the page
+            st.download_button(
+                "Download Resume",
+                data=resume_bytes,
+                file_name=RESUME_PATH.name,
+                mime="application/pdf",
+                key=f"resume_{resume_etag}",
+                on_click="ignore",
+                icon=":material/description:",
+            )
+        else:
+            st.warning("Resume PDF not found. Add it to assets/ as 'Jorge_Reyes_CV.pdf' (or update RESUME_PATH).")
+
+        links = [
+            action_link("https://www.linkedin.com/in/jorge-reyes-data-science/", "LinkedIn", "linkedin", new_tab=True),
+            action_link("https://github.com/JorgeRR89", "GitHub", "github", new_tab=True),
+        ]
+        st.markdown(f"<div class='action' style='margin-top:0;'>{''.join(links)}</div>", unsafe_allow_html=True)
 
     st.markdown("<div style='height:14px'></div>", unsafe_allow_html=True)
 
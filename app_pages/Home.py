@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import streamlit as st
+
+from src.brand import logo_file
+from src.hero import hero_component
+from src.theme import inject_theme
+
+st.set_page_config(
+    page_title="Portfolio JRR",
+    page_icon="🛰️",
+    layout="wide",
+    initial_sidebar_state="collapsed",
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+ASSETS = ROOT / "assets"
+
+VIDEO_WEBM = ASSETS / "Data.webm"
+VIDEO_MP4 = ASSETS / "Data.mp4"
+
+HERO_BUILD = ROOT / ".cache" / "hero"
+
+
+# Limpia UI Streamlit (la home es solo el hero: no necesita el design system)
+inject_theme(
+    """
+header[data-testid="stHeader"] {display:none;}
+footer {visibility:hidden;}
+.block-container { padding: 0 !important; max-width: 100% !important; }
+section.main > div { padding: 0 !important; }
+""",
+    base=False,
+)
+
+
+# =========================
+# HERO (shell precompilado)
+# =========================
+# El HTML se arma + minifica una sola vez por versión de assets y se sirve como
+# componente estático: cada rerun solo manda una referencia (nombre + args),
+# y el logo/video se piden por URL en lugar de ir en base64 dentro del HTML.
+hero = hero_component(HERO_BUILD, logo_file(), [VIDEO_WEBM, VIDEO_MP4])
+
+# ?debug=fps → frame-time / particle readout inside the hero
+debug_fps = st.query_params.get("debug", "") == "fps"
+
+hero(debug=debug_fps, height=920, key="hero", default=None)
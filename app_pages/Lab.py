@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
-from io import StringIO
+import html
 import textwrap
+import time
 
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
-import yaml
 
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_squared_error
+from src.charts import cached_series_figure, forecast_figure, series_hash
+from src.cached import catalog_raw, forecast, forecaster, load_csv, profile_asset, train_lab
+from src.loaders import file_fingerprint
+from src.perf import timer
+from src.profiling import profile_info_text
+from src.scoring import CHUNK_ROWS, iter_table_chunks, new_scored_token, score_chunks, scored_file, scored_url
+from src.theme import inject_theme
 
 
 # =========================
@@ -22,53 +23,12 @@ st.set_page_config(page_title="Lab • Portfolio JRR", page_icon="🧪", layout=
 
 
 # =========================
-# Premium minimal styles
+# Premium minimal styles (shared design system + Lab-only rules)
 # =========================
-st.markdown(
-    """
-<style>
-header[data-testid="stHeader"] {display:none;}
-footer {visibility:hidden;}
+LAB_CSS = """
 .block-container { padding-top: 1.6rem; padding-bottom: 3.2rem; max-width: 1100px; }
 
-:root{
-  --fg: rgba(255,255,255,.92);
-  --fg2: rgba(255,255,255,.70);
-  --line: rgba(255,255,255,.10);
-  --card: rgba(255,255,255,.04);
-  --card2: rgba(255,255,255,.06);
-  --shadow: rgba(0,0,0,.35);
-  --accent: rgba(255, 80, 90, .95);
-}
-
-html, body, [data-testid="stAppViewContainer"]{
-  background:
-    radial-gradient(900px 520px at 50% 0%, rgba(255,255,255,.06), rgba(0,0,0,.98)) !important;
-  color: var(--fg) !important;
-}
-
-h1,h2,h3{ letter-spacing:-0.03em; }
-p, li, small { color: var(--fg2); }
-a { text-decoration: none !important; }
-
-.hr{ height:1px; background: var(--line); margin: 16px 0 22px 0; }
-
-.topbar{
-  display:flex; align-items:flex-start; justify-content:space-between;
-  gap: 12px;
-  padding: 8px 0 8px 0;
-}
-.navbtns{ display:flex; gap:10px; flex-wrap:wrap; justify-content:flex-end; }
-.navbtns a{
-  display:inline-block;
-  padding: 9px 12px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(255,255,255,.04);
-  color: rgba(255,255,255,.88) !important;
-  font-size: 13px;
-}
-.navbtns a:hover{ background: rgba(255,255,255,.08); }
+.topbar{ padding: 8px 0 8px 0; }
 
 .hero{
   border: 1px solid rgba(255,255,255,.12);
@@ -96,23 +56,7 @@ a { text-decoration: none !important; }
   color: rgba(255,255,255,.78);
 }
 
-.card{
-  border: 1px solid var(--line);
-  background: linear-gradient(180deg, var(--card), rgba(0,0,0,.18));
-  border-radius: 18px;
-  padding: 16px 16px;
-  box-shadow: 0 18px 50px var(--shadow);
-}
-
-.pills{ display:flex; gap:8px; flex-wrap:wrap; margin-top: 10px; }
-.pill{
-  padding: 6px 9px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(0,0,0,.18);
-  color: rgba(255,255,255,.78);
-  font-size: 12px;
-}
+.card{ box-shadow: 0 18px 50px var(--shadow); }
 
 .kpi{
   display:grid;
@@ -144,6 +88,7 @@ a { text-decoration: none !important; }
   color: rgba(255,255,255,.84);
   overflow:auto;
   max-height: 310px;
+  white-space: pre;
 }
 .dslabel{
   font-size: 12px;
@@ -162,20 +107,6 @@ a { text-decoration: none !important; }
 
 .smallhint{ color: rgba(255,255,255,.60); font-size: 12px; }
 
-.links a{
-  display:inline-block;
-  padding: 8px 12px;
-  border-radius: 999px;
-  border: 1px solid var(--line);
-  background: rgba(255,255,255,.04);
-  color: rgba(255,255,255,.88) !important;
-  text-decoration:none;
-  margin-right: 8px;
-  margin-top: 10px;
-  font-size: 13px;
-}
-.links a:hover{ background: rgba(255,255,255,.07); }
-
 /* Make primary button feel premium */
 div[data-testid="stButton"] button[kind="primary"]{
   background: var(--accent) !important;
@@ -194,30 +125,13 @@ div[data-testid="stButton"] button[kind="secondary"]{
   border: 1px solid var(--line) !important;
   background: rgba(255,255,255,.04) !important;
 }
-
-</style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+inject_theme(LAB_CSS)
 
 
 # =========================
-# YAML loading (direct, robust)
+# Project lookup
 # =========================
-def load_yaml_dict(path: Path) -> dict:
-    if not path.exists():
-        return {}
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    return data if isinstance(data, dict) else {}
-
-
-def load_projects_raw(path: Path) -> list[dict]:
-    data = load_yaml_dict(path)
-    projects = data.get("projects", [])
-    return projects if isinstance(projects, list) else []
-
-
 def find_project(projects: list[dict], pid: str | None) -> dict | None:
     if not pid:
         return None
@@ -228,98 +142,12 @@ def find_project(projects: list[dict], pid: str | None) -> dict | None:
     return None
 
 
-# =========================
-# Time-series demo helpers
-# =========================
-def infer_datetime_col(df: pd.DataFrame) -> str | None:
-    # Prefer common names
-    candidates = ["datetime", "date", "timestamp", "time"]
-    cols = [c for c in df.columns]
-    for name in candidates:
-        for c in cols:
-            if name in str(c).lower():
-                try:
-                    pd.to_datetime(df[c], errors="raise")
-                    return c
-                except Exception:
-                    pass
-    # fallback: try any col
-    for c in cols:
-        try:
-            pd.to_datetime(df[c], errors="raise")
-            return c
-        except Exception:
-            continue
-    return None
-
-
-def infer_target_col(df: pd.DataFrame) -> str | None:
-    # Your typical taxi dataset uses num_orders
-    preferred = ["num_orders", "demand", "demand_units", "target"]
-    for c in preferred:
-        if c in df.columns:
-            return c
-    # fallback: first numeric column
-    num_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
-    return num_cols[0] if num_cols else None
-
-
-def make_features(ts: pd.Series, max_lag: int = 24, roll: int = 24) -> pd.DataFrame:
-    """
-    ts: hourly series
-    returns dataframe with calendar + lag + rolling features + target y
-    """
-    df = pd.DataFrame({"y": ts})
-    idx = df.index
-
-    df["year"] = idx.year
-    df["month"] = idx.month
-    df["day"] = idx.day
-    df["hour"] = idx.hour
-    df["dayofweek"] = idx.dayofweek
-
-    for lag in range(1, max_lag + 1):
-        df[f"lag_{lag}"] = df["y"].shift(lag)
-
-    df[f"rolling_mean_{roll}"] = df["y"].shift(1).rolling(roll).mean()
-    df = df.dropna()
-    return df
-
-
-def time_split(df: pd.DataFrame, train_frac: float = 0.9):
-    cut = int(len(df) * train_frac)
-    train = df.iloc[:cut]
-    test = df.iloc[cut:]
-    return train, test
-
-
-def rmse(y_true, y_pred) -> float:
-    return float(np.sqrt(mean_squared_error(y_true, y_pred)))
-
-
-def to_info_text(df: pd.DataFrame) -> str:
-    buf = StringIO()
-    df.info(buf=buf)
-    return buf.getvalue()
-
-
-def small_series_plot(ts: pd.Series, title: str = "Hourly demand (sample view)"):
-    fig = plt.figure(figsize=(7.2, 2.4), dpi=140)
-    ax = fig.add_subplot(111)
-    ax.plot(ts.index, ts.values)
-    ax.set_title(title, fontsize=10)
-    ax.tick_params(axis="x", labelrotation=0)
-    ax.grid(True, alpha=0.25)
-    fig.tight_layout()
-    return fig
-
-
 # =========================
 # Paths + query param
 # =========================
 ROOT = Path(__file__).parents[1]
 YAML_PATH = ROOT / "data" / "projects.yaml"
-projects = load_projects_raw(YAML_PATH)
+projects = catalog_raw(YAML_PATH)
 
 project_q = st.query_params.get("project")
 selected = find_project(projects, project_q)
@@ -450,20 +278,18 @@ if not demo_asset or demo_path is None or not demo_path.exists():
     )
     st.stop()
 
-# Load CSV (cached-ish via session)
-@st.cache_data(show_spinner=False)
-def _load_csv(path: str) -> pd.DataFrame:
-    return pd.read_csv(path)
-
-df_raw = _load_csv(str(demo_path))
+# Cached per asset version (src/cached.py, shared with the warming service)
+demo_fp = file_fingerprint(demo_path)
+df_raw = load_csv(str(demo_path), demo_fp)
+profile = profile_asset(str(demo_path), demo_fp)
 
 
 # =========================
 # Minimal KPIs (always)
 # =========================
-n_rows, n_cols = df_raw.shape
-n_missing = int(df_raw.isna().sum().sum())
-n_num = sum(pd.api.types.is_numeric_dtype(df_raw[c]) for c in df_raw.columns)
+n_rows, n_cols = profile["rows"], profile["cols"]
+n_missing = profile["n_missing"]
+n_num = profile["n_numeric"]
 
 st.markdown(
     f"""
@@ -504,70 +330,27 @@ st.session_state.setdefault("lab_payload", {})
 if run:
     st.session_state["lab_ran"] = True
 
-    # --- Prepare data as a time series
-    df = df_raw.copy()
-    dt_col = infer_datetime_col(df)
-    y_col = infer_target_col(df)
-
+    result = train_lab(str(demo_path), demo_fp)
     payload = {"ok": False}
 
-    if not dt_col or not y_col:
-        payload["error"] = "Could not infer datetime column or target column."
+    if not result.get("ok"):
+        payload["error"] = result.get("error", "Unknown error")
         st.session_state["lab_payload"] = payload
     else:
-        df[dt_col] = pd.to_datetime(df[dt_col], errors="coerce")
-        df = df.dropna(subset=[dt_col])
-        df = df.sort_values(dt_col)
-
-        # Build hourly series
-        ts = (
-            df.set_index(dt_col)[y_col]
-            .resample("H")
-            .sum()
-            .astype(float)
-        )
-
-        # Feature engineering
-        feat = make_features(ts, max_lag=24, roll=24)
-        train, test = time_split(feat, train_frac=0.9)
-
-        X_train = train.drop(columns=["y"])
-        y_train = train["y"]
-        X_test = test.drop(columns=["y"])
-        y_test = test["y"]
-
-        # Baseline: Linear Regression
-        lr = LinearRegression()
-        lr.fit(X_train, y_train)
-        pred_lr = lr.predict(X_test)
-        rmse_lr = rmse(y_test, pred_lr)
-
-        # Stronger: Random Forest (kept small for fast demo)
-        rf = RandomForestRegressor(
-            n_estimators=120,
-            random_state=42,
-            n_jobs=-1,
-            max_depth=None,
-            min_samples_leaf=2,
-        )
-        rf.fit(X_train, y_train)
-        pred_rf = rf.predict(X_test)
-        rmse_rf = rmse(y_test, pred_rf)
-
-        best_name, best_rmse = ("Random Forest", rmse_rf) if rmse_rf <= rmse_lr else ("Linear Regression", rmse_lr)
-
+        ts = result["ts"]
         payload.update(
             {
                 "ok": True,
-                "dt_col": dt_col,
-                "y_col": y_col,
+                "dt_col": result["dt_col"],
+                "y_col": result["y_col"],
                 "ts": ts,
-                "rmse_lr": float(rmse_lr),
-                "rmse_rf": float(rmse_rf),
-                "best_name": best_name,
-                "best_rmse": float(best_rmse),
+                "ts_hash": series_hash(ts),
+                "rmse_lr": result["rmse_lr"],
+                "rmse_rf": result["rmse_rf"],
+                "best_name": result["best_name"],
+                "best_rmse": result["best_rmse"],
                 "head5": df_raw.head(5),
-                "info": to_info_text(df_raw),
+                "info": profile_info_text(profile),
             }
         )
         st.session_state["lab_payload"] = payload
@@ -610,9 +393,11 @@ if st.session_state["lab_ran"]:
         st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
         st.markdown("### Tiny visual (example)")
         ts = payload["ts"]
-        fig = small_series_plot(ts.tail(min(len(ts), 24 * 21)), title=f"Hourly {payload['y_col']} (last ~3 weeks)")
+        # Full history, LTTB-downsampled server-side; opens on the last ~3 weeks (drag the range slider to pan)
+        with timer("series_figure"):
+            fig = cached_series_figure(ts, title=f"Hourly {payload['y_col']} (full history)", data_hash=payload["ts_hash"])
         st.markdown("<div class='card'>", unsafe_allow_html=True)
-        st.pyplot(fig, clear_figure=True)
+        st.plotly_chart(fig, width="stretch", config={"displaylogo": False})
         st.markdown("</div>", unsafe_allow_html=True)
 
         # Result: recruiter-friendly expected outcome
@@ -642,6 +427,39 @@ if st.session_state["lab_ran"]:
             unsafe_allow_html=True,
         )
 
+        # Forecast (serving mode): recursive H-step-ahead with the best model
+        st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
+        st.markdown("### Forecast (next hours)")
+
+        fc_model = forecaster(str(demo_path), demo_fp)
+        if fc_model is None:
+            st.markdown("<div class='smallhint'>Forecasting is unavailable for this dataset.</div>", unsafe_allow_html=True)
+        else:
+            fA, fB = st.columns([1, 1], gap="large")
+            with fA:
+                horizon = st.slider("Horizon (hours)", min_value=6, max_value=168, value=24, step=6)
+            with fB:
+                level = st.select_slider("Prediction interval", options=[0.8, 0.9, 0.95], value=0.8, format_func=lambda v: f"{int(v * 100)}%")
+
+            t0 = time.perf_counter()
+            with timer("forecast"):
+                fc = forecast(str(demo_path), demo_fp, horizon, level)
+            served_ms = (time.perf_counter() - t0) * 1000.0
+            lat = fc["latency_ms"]  # per-step compute time, measured when the forecast was first computed
+            fig = forecast_figure(
+                ts.tail(min(len(ts), 24 * 7)),
+                fc,
+                title=f"{payload['best_name']} • {horizon}h ahead ({int(level * 100)}% interval)",
+            )
+            st.markdown("<div class='card'>", unsafe_allow_html=True)
+            st.plotly_chart(fig, width="stretch", config={"displaylogo": False})
+            st.markdown("</div>", unsafe_allow_html=True)
+            st.markdown(
+                f"<div class='smallhint'>Served in {served_ms:.1f} ms • computed in {lat.sum():.1f} ms • "
+                f"p50 {lat.median():.2f} ms/step • p95 {lat.quantile(0.95):.2f} ms/step</div>",
+                unsafe_allow_html=True,
+            )
+
         # System summary (business + systems)
         st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
         st.markdown(
@@ -667,6 +485,88 @@ if st.session_state["lab_ran"]:
         )
 
 
+# =========================
+# Batch scoring (uploaded files)
+# =========================
+if st.session_state["lab_ran"] and st.session_state.get("lab_payload", {}).get("ok"):
+    st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
+    st.markdown("### Batch scoring")
+    max_mb = st.get_option("server.maxUploadSize")
+    st.markdown(
+        "<div class='smallhint'>Upload an hourly CSV/Parquet (same columns as the demo), sorted, "
+        f"one row per hour with no gaps, up to {max_mb} MB (<code>server.maxUploadSize</code>). "
+        "The upload is held in memory; scoring streams it in fixed-size chunks through the "
+        "feature engine and the trained model, and each row gets a one-step-ahead prediction. "
+        "The scored file is written to disk and kept for a couple of hours.</div>",
+        unsafe_allow_html=True,
+    )
+
+    upload = st.file_uploader("Dataset to score", type=["csv", "parquet"], label_visibility="collapsed")
+    if upload is not None and st.button("Score file", type="secondary"):
+        result = train_lab(str(demo_path), demo_fp)
+        bar = st.progress(0.0, text="Scoring…")
+        # one scored file per session (same name on every re-score); expired ones are swept
+        token = st.session_state.setdefault("lab_scoring_token", new_scored_token())
+        path = scored_file(token)
+        tmp = path.with_name(path.name + ".tmp")
+        st.session_state.pop("lab_scoring", None)
+        try:
+            with open(tmp, "w", encoding="utf-8", newline="") as out:
+                stats = score_chunks(
+                    iter_table_chunks(upload, upload.name, CHUNK_ROWS),
+                    result["best_model"],
+                    out,
+                    dt_col=result["dt_col"],
+                    y_col=result["y_col"],
+                    max_lag=result["max_lag"],
+                    roll=result["roll"],
+                    on_chunk=lambda s: bar.progress(
+                        min(1.0, upload.tell() / max(upload.size, 1)),
+                        text=f"{s['rows']:,} rows • {s['rows_per_s']:,.0f} rows/s",
+                    ),
+                )
+            tmp.replace(path)
+            st.session_state["lab_scoring"] = {
+                "path": str(path),
+                "url": f"{scored_url(path)}?v={time.time_ns()}",  # re-scores: never a cached copy
+                "name": Path(upload.name).stem + "_scored.csv",
+                **stats,
+            }
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            st.session_state["lab_scoring"] = {"error": str(e)}
+        bar.empty()
+
+    scored = st.session_state.get("lab_scoring")
+    if scored and scored.get("error"):
+        st.markdown(
+            f"""
+<div class="card resultwarn">
+  <h3 style="margin-top:0;">Could not score the file</h3>
+  <div class="subtitle">{html.escape(scored["error"])}</div>
+</div>
+""",
+            unsafe_allow_html=True,
+        )
+    elif scored and Path(scored["path"]).exists():
+        short = scored["rows"] - scored["dropped"] - scored["scored"]
+        skipped = f" • {scored['dropped']:,} skipped (unparseable timestamp)" if scored["dropped"] else ""
+        st.markdown(
+            f"<div class='smallhint'>{scored['rows']:,} rows • {scored['scored']:,} scored • "
+            f"{short:,} without enough history{skipped} • "
+            f"{scored['chunks']} chunks • {scored['seconds']:.2f} s • {scored['rows_per_s']:,.0f} rows/s</div>",
+            unsafe_allow_html=True,
+        )
+        # static file link: streamed from disk by the server, not held by this session
+        st.markdown(
+            f"<div class='navbtns'><a href='{scored['url']}' download='{html.escape(scored['name'], quote=True)}'>"
+            "Download predictions</a></div>",
+            unsafe_allow_html=True,
+        )
+    elif scored:
+        st.markdown("<div class='smallhint'>The scored file has expired. Score the file again.</div>", unsafe_allow_html=True)
+
+
 # =========================
 # How I built it (optional)
 # =========================
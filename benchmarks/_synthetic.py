@@ -0,0 +1,23 @@
+"""
+Synthetic inputs shared by the benchmarks.
+
+Only numpy / pandas here, never the repo's src/: bench_pages imports this module
+before it puts the src/ of its temporary tree on sys.path.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_hourly(rows: int, seed: int = 0, str_timestamps: bool = False) -> pd.DataFrame:
+    """
+    Hourly demand series (daily + weekly seasonality, Gaussian noise) with a
+    "timestamp" and a "demand" column. str_timestamps: timestamps as strings, like a
+    freshly read CSV.
+    """
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=rows, freq="h")
+    t = np.arange(rows)
+    y = 100 + 35 * np.sin(2 * np.pi * t / 24) + 12 * np.sin(2 * np.pi * t / 168) + rng.normal(0, 6, rows)
+    return pd.DataFrame({"timestamp": idx.astype(str) if str_timestamps else idx, "demand": np.clip(y, 0, None).round()})
@@ -0,0 +1,53 @@
+"""
+Latency of the Lab forecast serving path (recursive H-step-ahead).
+
+    python benchmarks/bench_forecast.py [--rows 5000] [--horizons 24 72 168] [--repeat 5]
+
+Trains the Lab models once on a synthetic hourly series, then reports total and
+per-step latency for every horizon and model.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _synthetic import synthetic_hourly  # noqa: E402
+from src.forecast import RecursiveForecaster  # noqa: E402
+from src.lab_pipeline import run_demo  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=5000)
+    ap.add_argument("--horizons", type=int, nargs="+", default=[24, 72, 168])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    result = run_demo(synthetic_hourly(args.rows))
+    if not result.get("ok"):
+        raise SystemExit(result.get("error"))
+
+    print(f"rows={args.rows} best={result['best_name']}")
+    print(f"{'model':<18} {'H':>5} {'total ms':>10} {'p50 ms/step':>12} {'p95 ms/step':>12}")
+    for name, model in result["models"].items():
+        fc = RecursiveForecaster(model, result["ts"], residual_std=result["residual_std"])
+        for h in args.horizons:
+            totals, steps = [], []
+            for _ in range(args.repeat):
+                out = fc.forecast(h)
+                totals.append(out["latency_ms"].sum())
+                steps.append(out["latency_ms"].to_numpy())
+            steps = np.concatenate(steps)
+            print(
+                f"{name:<18} {h:>5} {np.median(totals):>10.2f} "
+                f"{np.percentile(steps, 50):>12.3f} {np.percentile(steps, 95):>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
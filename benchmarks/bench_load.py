@@ -0,0 +1,240 @@
+"""
+Load test: N concurrent visitor sessions against a local server (websocket clients).
+
+    python benchmarks/bench_load.py [--sessions 10] [--flows 3] [--ramp 2]
+                                    [--url http://localhost:8501] [--search forecast] [--project taxi_demand]
+                                    [--max-error-pct 1]
+
+Each session is one browser tab speaking Streamlit's websocket protocol and repeats
+the recruiter flow --flows times:
+
+  home → projects → search (--search) → lab (?project=) → keep it simple
+
+Without --url a server is started for the run (headless, free port) and stopped
+at the end. Reported per step and overall: count, throughput, p50 / p95 / p99
+latency (request sent → script_finished) and error rate (exceptions rendered by
+the page, failed runs, timeouts, dropped connections). Latencies are over successful
+runs only ("n/a" if none succeeded). The exit code is 1 if the overall error rate
+is above --max-error-pct.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+STEPS = ("home", "projects", "search", "lab", "keep_it_simple")
+RUN_BUTTON = "Keep it simple"
+SEARCH_LABEL = "Search"
+
+
+# =========================
+# Local server
+# =========================
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def local_server(timeout: float = 60.0) -> Iterator[str]:
+    port = _free_port()
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", "Command_Center.py",
+        "--server.headless", "true", "--server.port", str(port), "--browser.gatherUsageStats", "false",
+    ]
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"{url}/_stcore/health", timeout=2) as r:
+                    if r.status == 200:
+                        break
+            except OSError:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    raise SystemExit(f"streamlit server did not start (exit code {proc.poll()})")
+                time.sleep(0.25)
+        yield url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+# =========================
+# One session
+# =========================
+class Session:
+    """One websocket session; run() = one script run, as the browser triggers it."""
+
+    def __init__(self, ws, timeout: float):
+        self.ws, self.timeout = ws, timeout
+        self.widgets: Dict[str, str] = {}  # label -> widget id of the last run
+
+    async def run(self, page: str, query: str = "", widget: Optional[Tuple[str, object]] = None) -> Optional[str]:
+        """Returns None if the run finished cleanly, else a short error description."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = query
+        msg.rerun_script.page_name = page
+        if widget is not None:
+            label, value = widget
+            if label not in self.widgets:
+                return f"widget '{label}' not found"
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = self.widgets[label]
+            if value is True:
+                state.trigger_value = True
+            else:
+                state.string_value = str(value)
+        await self.ws.send(msg.SerializeToString())
+
+        self.widgets = {}
+        error = None
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.timeout))
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                el = fwd.delta.new_element
+                el_kind = el.WhichOneof("type")
+                if el_kind == "exception" and error is None:
+                    error = f"exception: {el.exception.type}"
+                elif el_kind in ("button", "text_input"):
+                    inner = getattr(el, el_kind)
+                    self.widgets[inner.label] = inner.id
+            elif kind == "script_finished":
+                status = ForwardMsg.ScriptFinishedStatus.Name(fwd.script_finished)
+                if status not in ("FINISHED_SUCCESSFULLY", "FINISHED_EARLY_FOR_RERUN"):
+                    error = error or status
+                return error
+
+
+async def visitor(
+    url: str, flows: int, search: str, project: str, timeout: float, samples: List[Tuple[str, float, Optional[str]]]
+) -> None:
+    ws_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    lab_query = f"project={project}"
+    try:
+        async with websockets.connect(ws_url, subprotocols=["streamlit"], max_size=None) as ws:
+            s = Session(ws, timeout)
+            for _ in range(flows):
+                for step, call in (
+                    ("home", lambda: s.run("")),
+                    ("projects", lambda: s.run("Projects")),
+                    ("search", lambda: s.run("Projects", widget=(SEARCH_LABEL, search))),
+                    ("lab", lambda: s.run("Lab", lab_query)),
+                    ("keep_it_simple", lambda: s.run("Lab", lab_query, widget=(RUN_BUTTON, True))),
+                ):
+                    t0 = time.perf_counter()
+                    try:
+                        error = await call()
+                    except asyncio.TimeoutError:
+                        error = "timeout"
+                    samples.append((step, (time.perf_counter() - t0) * 1000.0, error))
+                    if error == "timeout":
+                        return  # the session is stuck on that run
+    except (OSError, websockets.WebSocketException) as e:
+        samples.append(("connect", 0.0, f"{type(e).__name__}: {e}"))
+
+
+async def load(url: str, args: argparse.Namespace) -> Tuple[List[Tuple[str, float, Optional[str]]], float]:
+    samples: List[Tuple[str, float, Optional[str]]] = []
+    delay = args.ramp / max(args.sessions, 1)
+
+    async def delayed(i: int) -> None:
+        await asyncio.sleep(i * delay)
+        await visitor(url, args.flows, args.search, args.project, args.timeout, samples)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(delayed(i) for i in range(args.sessions)))
+    return samples, time.perf_counter() - t0
+
+
+# =========================
+# Report
+# =========================
+def report(samples: List[Tuple[str, float, Optional[str]]], elapsed: float) -> float:
+    """Prints the tables; returns the overall error rate in % (100 if there are no samples)."""
+    print(f"\n{'step':<16} {'runs':>6} {'err %':>6} {'runs/s':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    groups = {step: [s for s in samples if s[0] == step] for step in (*STEPS, "connect")}
+    groups["all"] = samples
+    for step, rows in groups.items():
+        if not rows:
+            continue
+        ok = np.asarray([ms for _, ms, err in rows if err is None])
+        errors = len(rows) - len(ok)
+        if len(ok):
+            latency = f"{np.percentile(ok, 50):>9.0f} {np.percentile(ok, 95):>9.0f} {np.percentile(ok, 99):>9.0f} {ok.max():>9.0f}"
+        else:  # every run failed: no latency to report
+            latency = " ".join(f"{'n/a':>9}" for _ in range(4))
+        print(f"{step:<16} {len(rows):>6} {100.0 * errors / len(rows):>6.1f} {len(rows) / elapsed:>7.2f} {latency}")
+    flows = sum(1 for step, _, err in samples if step == STEPS[-1] and err is None)
+    print(f"\n{flows} complete flows in {elapsed:.1f} s ({flows / elapsed:.2f} flows/s)")
+    errors: Dict[str, int] = {}
+    for step, _, err in samples:
+        if err is not None:
+            errors[f"{step}: {err}"] = errors.get(f"{step}: {err}", 0) + 1
+    for err, n in sorted(errors.items(), key=lambda kv: -kv[1]):
+        print(f"  {n:>4} x {err}")
+    return 100.0 * sum(errors.values()) / len(samples) if samples else 100.0
+
+
+def default_project() -> str:
+    from src.loaders import load_yaml
+
+    for p in load_yaml(ROOT / "data" / "projects.yaml").get("projects", []) or []:
+        asset = ((p or {}).get("lab") or {}).get("demo_asset", "")
+        if asset and (ROOT / asset).is_file():
+            return str(p.get("id", ""))
+    return ""
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sessions", type=int, default=10, help="concurrent sessions")
+    ap.add_argument("--flows", type=int, default=3, help="flows per session")
+    ap.add_argument("--ramp", type=float, default=2.0, help="seconds over which sessions connect")
+    ap.add_argument("--url", help="existing server (default: start one for the run)")
+    ap.add_argument("--search", default="forecast")
+    ap.add_argument("--project", default=None, help="Lab project (default: first with a demo asset)")
+    ap.add_argument("--timeout", type=float, default=120.0, help="seconds to wait for one run")
+    ap.add_argument("--max-error-pct", type=float, default=1.0, help="exit 1 above this overall error rate")
+    args = ap.parse_args()
+    args.project = args.project or default_project()
+
+    print(f"{args.sessions} sessions x {args.flows} flows, lab project={args.project!r}")
+    if args.url:
+        samples, elapsed = asyncio.run(load(args.url, args))
+    else:
+        with local_server() as url:
+            samples, elapsed = asyncio.run(load(url, args))
+    error_pct = report(samples, elapsed)
+    if error_pct > args.max_error_pct:
+        print(f"\nerror rate {error_pct:.1f}% over {args.max_error_pct:g}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
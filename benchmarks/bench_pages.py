@@ -0,0 +1,300 @@
+"""
+Cold / warm script execution of every page, headless (streamlit AppTest).
+
+    python benchmarks/bench_pages.py [--catalogs 10 100 1000] [--rows 1000 10000 100000 1000000]
+                                     [--train-max 10000] [--repeat 3] [--baseline benchmarks/baseline_pages.json]
+                                     [--save-baseline] [--tolerance 1.25] [--slack-ms 100]
+                                     [--max-payload-kb 1024]
+
+The app (entry point, app_pages/, src/, .streamlit/, assets/) is copied into a
+temporary tree whose data/ holds synthetic catalogs (N projects) and Lab datasets
+(hourly series of R rows), so the repo's own data is never touched.
+
+Per scenario:
+  cold  first run after every process cache is cleared (st.cache_*, figure LRU,
+        hero / brand builds, warm-up state). Module imports are not part of it:
+        an untimed pass over every page (training included) runs first, so no
+        scenario pays pandas / scikit-learn / scipy for the ones after it
+        (import cost per entry point: benchmarks/coldstart.py)
+  warm  following runs, new session each (what the next visitor gets); best of --repeat
+  wall ms, peak MB (tracemalloc, separate cold run so it doesn't skew wall time)
+  and payload KB (serialized element protos of the rendered page).
+
+Without --save-baseline the results are compared against the stored baseline;
+the exit code is 1 if any cold/warm wall time or payload exceeds it by more than
+--tolerance (and wall time by more than --slack-ms), or if a payload is over
+--max-payload-kb whatever the baseline says (a baseline is not saved then either);
+peak memory is reported, not gated.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from _synthetic import synthetic_hourly  # numpy / pandas only: src/ comes from the temporary tree
+
+REPO = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = Path(__file__).with_name("baseline_pages.json")
+
+COPY = ["Command_Center.py", "app_pages", "src", ".streamlit", "assets"]
+LAB_ID = "bench_lab"
+
+
+# =========================
+# Synthetic data
+# =========================
+def synthetic_catalog(n: int, covers: List[str], demo_asset: str = "") -> Dict[str, Any]:
+    industries = ["Mobility", "Retail", "Media", "Marketing", "Energy"]
+    types = ["Forecasting", "Computer Vision", "NLP", "Optimization"]
+    projects = []
+    for i in range(n):
+        projects.append(
+            {
+                "id": LAB_ID if i == 0 else f"p{i:04d}",
+                "title": f"Project {i}",
+                "tagline": f"Synthetic project number {i} for benchmarks.",
+                "spotlight": i == 0,
+                "industry": industries[i % len(industries)],
+                "type": types[i % len(types)],
+                "impact_type": ["Revenue", "Cost", "Risk"][i % 3],
+                "status": ["Done", "In progress"][i % 2],
+                "year": str(2018 + i % 8),
+                "cover": covers[i % len(covers)] if covers else "",
+                "skills": ["Time series", "Feature engineering", "Evaluation"],
+                "tools": ["Python", "pandas", "scikit-learn"],
+                "outcomes": [f"Outcome {i}.a", f"Outcome {i}.b"],
+                "problem": "Problem statement " * 8,
+                "approach": "Approach description " * 8,
+                "results": "Results summary " * 8,
+                "details": "",
+                "links": {"github": "https://github.com/example/repo"},
+                "lab": {"demo_asset": demo_asset if i == 0 else ""},
+            }
+        )
+    return {"projects": projects}
+
+
+def build_tree(root: Path) -> List[str]:
+    """Copies the app into `root`; returns the repo-relative cover paths available."""
+    for name in COPY:
+        src = REPO / name
+        if src.is_dir():
+            shutil.copytree(src, root / name, ignore=shutil.ignore_patterns("__pycache__"))
+        elif src.exists():
+            shutil.copy2(src, root / name)
+    (root / "data" / "lab").mkdir(parents=True, exist_ok=True)
+    return sorted(p.relative_to(root).as_posix() for p in (root / "assets" / "projects").glob("*.png"))
+
+
+# =========================
+# Runs
+# =========================
+def reset_caches() -> None:
+    """Empties every process-level cache the pages use (a fresh server process)."""
+    import streamlit as st
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    from src import assets, brand, charts, hero, warm
+
+    with assets._covers_lock:
+        assets._covers.clear()
+    with charts._figure_lock:
+        charts._figure_cache.clear()
+    with hero._build_lock:
+        hero._builds.clear()
+    with brand._lock:
+        brand._built.clear()
+    with warm._lock:
+        warm._done.clear()
+        warm._pending.clear()
+        warm._startup = None
+
+
+def wait_background() -> None:
+    """Lets the router's warm-up thread finish so it doesn't bleed into the next run."""
+    from src import warm
+
+    worker = warm._worker
+    if worker is not None:
+        worker.join()
+
+
+def payload_bytes(node: Any) -> int:
+    kids = getattr(node, "children", None)
+    if kids:
+        return sum(payload_bytes(c) for c in kids.values())
+    proto = getattr(node, "proto", None)
+    return len(proto.SerializeToString()) if proto is not None else 0
+
+
+def run_once(script: Path, query: Dict[str, str], action: Optional[Callable[[Any], None]]) -> Dict[str, float]:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(script), default_timeout=600)
+    for k, v in query.items():
+        at.query_params[k] = v
+    t0 = time.perf_counter()
+    at.run()
+    if action is not None:
+        action(at)
+    wall = (time.perf_counter() - t0) * 1000.0
+    if at.exception:
+        raise RuntimeError(f"{script.name}: {at.exception[0].value}")
+    out = {"wall_ms": wall, "payload_kb": payload_bytes(at._tree) / 1024.0}
+    wait_background()
+    return out
+
+
+def measure(
+    script: Path, query: Dict[str, str], action: Optional[Callable[[Any], None]] = None, repeat: int = 3
+) -> Dict[str, float]:
+    reset_caches()
+    cold = run_once(script, query, action)
+    warm = min((run_once(script, query, action) for _ in range(repeat)), key=lambda r: r["wall_ms"])
+
+    reset_caches()
+    tracemalloc.start()
+    run_once(script, query, action)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "cold_ms": round(cold["wall_ms"], 1),
+        "warm_ms": round(warm["wall_ms"], 1),
+        "peak_mb": round(peak / 2**20, 1),
+        "payload_kb": round(warm["payload_kb"], 1),
+    }
+
+
+def click_run(at: Any) -> None:
+    at.button[0].click().run()
+
+
+def preload(root: Path, covers: List[str]) -> None:
+    """
+    Untimed pass over every page, training included: one-time imports (and lazy
+    imports inside pandas / scikit-learn) happen here, not in whichever scenario
+    would otherwise come first.
+    """
+    csv = root / "data" / "lab" / "bench_preload.csv"
+    synthetic_hourly(1_000).to_csv(csv, index=False)
+    data = root / "data" / "projects.yaml"
+    data.write_text(yaml.safe_dump(synthetic_catalog(10, covers, csv.relative_to(root).as_posix())), encoding="utf-8")
+    for script in ["Command_Center.py", *(f"app_pages/{p.name}" for p in sorted((root / "app_pages").glob("*.py")))]:
+        run_once(root / script, {}, None)
+    run_once(root / "app_pages" / "Lab.py", {"project": LAB_ID}, click_run)
+    csv.unlink()
+    reset_caches()
+
+
+# =========================
+# Report
+# =========================
+GATED = ("cold_ms", "warm_ms", "payload_kb")
+COLS = ("cold_ms", "warm_ms", "peak_mb", "payload_kb")
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    slack_ms: float,
+    max_payload_kb: float,
+) -> bool:
+    ok = True
+    print(f"\n{'scenario':<24}" + "".join(f"{c:>22}" for c in COLS))
+    for name, r in results.items():
+        base = baseline.get(name, {})
+        cells = []
+        for c in COLS:
+            # absolute cap: a baseline recorded with an oversized payload must not make it "normal"
+            capped = c == "payload_kb" and r[c] > max_payload_kb
+            if c in base and base[c]:
+                ratio = r[c] / base[c]
+                slower = ratio > tolerance and (not c.endswith("_ms") or r[c] - base[c] > slack_ms)
+                flag = " !" if (c in GATED and slower) or capped else "  "
+                cells.append(f"{r[c]:>10.1f} ({ratio:>5.2f}x){flag}")
+            else:
+                flag = " !" if capped else "  "
+                cells.append(f"{r[c]:>10.1f}    (new){flag}")
+            ok &= flag == "  "
+        print(f"{name:<24}" + "".join(f"{cell:>22}" for cell in cells))
+    return ok
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--catalogs", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    ap.add_argument("--train-max", type=int, default=10_000, help="also click 'Keep it simple' up to this many rows")
+    ap.add_argument("--repeat", type=int, default=3, help="warm runs per scenario (best one is kept)")
+    ap.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--tolerance", type=float, default=1.25)
+    ap.add_argument("--slack-ms", type=float, default=100.0, help="ignore slowdowns smaller than this (timer noise)")
+    ap.add_argument("--max-payload-kb", type=float, default=1024.0, help="fail any scenario above this payload")
+    args = ap.parse_args()
+    logging.disable(logging.WARNING)  # Streamlit's bare-mode warnings, on every AppTest run
+
+    tmp = Path(tempfile.mkdtemp(prefix="bench_pages_"))
+    try:
+        covers = build_tree(tmp)
+        sys.path.insert(0, str(tmp))  # src/ of the temporary tree
+        data = tmp / "data" / "projects.yaml"
+        pages = tmp / "app_pages"
+        results: Dict[str, Dict[str, float]] = {}
+        preload(tmp, covers)
+
+        def record(name: str, r: Dict[str, float]) -> None:
+            results[name] = r
+            print(f"{name:<24} cold {r['cold_ms']:>9.1f} ms  warm {r['warm_ms']:>8.1f} ms  "
+                  f"peak {r['peak_mb']:>7.1f} MB  payload {r['payload_kb']:>8.1f} KB", flush=True)
+
+        data.write_text(yaml.safe_dump(synthetic_catalog(10, covers)), encoding="utf-8")
+        record("home", measure(tmp / "Command_Center.py", {}, repeat=args.repeat))
+        record("about", measure(pages / "1_About_Me.py", {}, repeat=args.repeat))
+        record("contact", measure(pages / "3_Contact.py", {}, repeat=args.repeat))
+
+        for n in args.catalogs:
+            data.write_text(yaml.safe_dump(synthetic_catalog(n, covers)), encoding="utf-8")
+            record(f"projects[{n}]", measure(pages / "2_Projects.py", {}, repeat=args.repeat))
+
+        for rows in args.rows:
+            csv = tmp / "data" / "lab" / f"bench_{rows}.csv"
+            synthetic_hourly(rows).to_csv(csv, index=False)
+            data.write_text(
+                yaml.safe_dump(synthetic_catalog(10, covers, csv.relative_to(tmp).as_posix())), encoding="utf-8"
+            )
+            record(f"lab[{rows}]", measure(pages / "Lab.py", {"project": LAB_ID}, repeat=args.repeat))
+            if rows <= args.train_max:
+                record(f"lab_train[{rows}]", measure(pages / "Lab.py", {"project": LAB_ID}, click_run, args.repeat))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    over = {name: r["payload_kb"] for name, r in results.items() if r["payload_kb"] > args.max_payload_kb}
+    if args.save_baseline and over:
+        raise SystemExit(f"not saving the baseline, payload over {args.max_payload_kb:.0f} KB: {over}")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"\nbaseline saved to {args.baseline}")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    if not compare(results, baseline, args.tolerance, args.slack_ms, args.max_payload_kb):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
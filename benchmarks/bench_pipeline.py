@@ -0,0 +1,117 @@
+"""
+Micro-benchmarks of the Lab pipeline stages (src/lab_pipeline.py), one at a time
+(pytest-benchmark):
+
+    pytest benchmarks/bench_pipeline.py [--benchmark-autosave] [--benchmark-compare]
+                                        [-k "make_features and 100000"]
+
+Every stage gets its input prepared outside the timed region (pipeline up to the
+previous stage, built once per row count / lag depth) and is parametrized on row
+count and, where it matters, lag depth. Stages that don't depend on lag depth
+(column inference, hourly resampling) only on row count; model fits stop at
+FIT_MAX rows. The file is not collected by a plain `pytest` (bench_* names); it is
+skipped when pytest-benchmark is not installed.
+"""
+from __future__ import annotations
+
+import functools
+import sys
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sklearn.ensemble import RandomForestRegressor  # noqa: E402
+from sklearn.linear_model import LinearRegression  # noqa: E402
+
+from _synthetic import synthetic_hourly  # noqa: E402
+from src import lab_pipeline as lp  # noqa: E402
+
+ROWS = (1_000, 10_000, 100_000)
+LAGS = (24, 72, 168)
+FIT_MAX = 10_000  # largest row count for lr_fit / rf_fit
+
+# make_features inserts one column per lag: pandas warns about fragmentation past ~100
+pytestmark = pytest.mark.filterwarnings("ignore::pandas.errors.PerformanceWarning")
+
+
+def _xy(df: pd.DataFrame, cols: List[str]):
+    return df[cols].to_numpy(dtype=float), df["y"].to_numpy(dtype=float)
+
+
+@functools.lru_cache(maxsize=None)
+def _raw(rows: int) -> Dict[str, Any]:
+    raw = synthetic_hourly(rows, str_timestamps=True)  # like a freshly read CSV
+    dt_col, y_col = lp.infer_datetime_col(raw), lp.infer_target_col(raw)
+    return {"raw": raw, "dt_col": dt_col, "y_col": y_col, "ts": lp.hourly_series(raw, dt_col, y_col)}
+
+
+@functools.lru_cache(maxsize=None)
+def _features(rows: int, lag: int) -> Dict[str, Any]:
+    """Inputs of the lag-dependent stages, exactly as run_demo chains them."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+        feat = lp.make_features(_raw(rows)["ts"], max_lag=lag, roll=lp.ROLL)
+    train, _ = lp.time_split(feat, lp.TRAIN_FRAC)
+    cols = lp.feature_names(lag, lp.ROLL)
+    X, y = _xy(train, cols)
+    return {"feat": feat, "train": train, "cols": cols, "X": X, "y": y}
+
+
+# The stages are timed with their src.perf timer around them (as in the app); its
+# cost is a few microseconds per call.
+@pytest.mark.parametrize("rows", ROWS)
+def test_infer_datetime_col(benchmark, rows):
+    benchmark(lp.infer_datetime_col, _raw(rows)["raw"])
+
+
+@pytest.mark.parametrize("rows", ROWS)
+def test_infer_target_col(benchmark, rows):
+    benchmark(lp.infer_target_col, _raw(rows)["raw"])
+
+
+@pytest.mark.parametrize("rows", ROWS)
+def test_hourly_series(benchmark, rows):
+    r = _raw(rows)
+    benchmark(lp.hourly_series, r["raw"], r["dt_col"], r["y_col"])
+
+
+@pytest.mark.parametrize("lag", LAGS)
+@pytest.mark.parametrize("rows", ROWS)
+def test_make_features(benchmark, rows, lag):
+    benchmark(lp.make_features, _raw(rows)["ts"], max_lag=lag, roll=lp.ROLL)
+
+
+@pytest.mark.parametrize("lag", LAGS)
+@pytest.mark.parametrize("rows", ROWS)
+def test_time_split(benchmark, rows, lag):
+    benchmark(lp.time_split, _features(rows, lag)["feat"], lp.TRAIN_FRAC)
+
+
+@pytest.mark.parametrize("lag", LAGS)
+@pytest.mark.parametrize("rows", ROWS)
+def test_to_numpy(benchmark, rows, lag):
+    f = _features(rows, lag)
+    benchmark(_xy, f["train"], f["cols"])
+
+
+@pytest.mark.parametrize("lag", LAGS)
+@pytest.mark.parametrize("rows", [r for r in ROWS if r <= FIT_MAX])
+def test_lr_fit(benchmark, rows, lag):
+    f = _features(rows, lag)
+    benchmark(lambda: LinearRegression().fit(f["X"], f["y"]))
+
+
+@pytest.mark.parametrize("lag", LAGS)
+@pytest.mark.parametrize("rows", [r for r in ROWS if r <= FIT_MAX])
+def test_rf_fit(benchmark, rows, lag):
+    f = _features(rows, lag)
+    rf_params = dict(n_estimators=120, random_state=42, n_jobs=-1, min_samples_leaf=2)  # as in run_demo
+    # a fit takes seconds: a few rounds are enough
+    benchmark.pedantic(lambda: RandomForestRegressor(**rf_params).fit(f["X"], f["y"]), rounds=3, iterations=1)
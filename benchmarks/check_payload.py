@@ -0,0 +1,157 @@
+"""
+Payload budget per page: what each page pushes over the websocket on a run.
+
+    python benchmarks/check_payload.py [--pages home projects ...] [--budgets benchmarks/payload_budgets.json]
+                                       [--top 5] [--json report.json]
+
+Renders every route of src/nav.py headlessly (streamlit AppTest) against the repo's
+own data, sizes each emitted element (serialized proto: markdown / html bodies,
+components.html srcdoc, custom component args, charts, ...) and prints a breakdown
+per page: total vs budget, bytes by element kind, bytes of inline data: URIs
+(base64 images, video, PDFs) and the largest elements.
+
+Budgets (KB per page) live in payload_budgets.json next to this script; the exit
+code is 1 if any page is over its budget. Files served through the media endpoint
+(st.download_button, st.image) or app/static are fetched separately by the browser
+and are not part of the payload.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+logging.disable(logging.WARNING)  # Streamlit's bare-mode warnings (caches, every AppTest run)
+
+from src.loaders import load_yaml  # noqa: E402
+from src.nav import ROUTES  # noqa: E402
+
+DEFAULT_BUDGETS = Path(__file__).with_name("payload_budgets.json")
+DATA_URI = re.compile(rb"data:[\w.+-]+/[\w.+-]+;base64,[A-Za-z0-9+/=]+")
+
+
+def lab_project() -> str:
+    """First catalog project whose Lab demo asset exists (the page is empty without one)."""
+    for p in load_yaml(ROOT / "data" / "projects.yaml").get("projects", []) or []:
+        asset = ((p or {}).get("lab") or {}).get("demo_asset", "")
+        if asset and (ROOT / asset).is_file():
+            return str(p.get("id", ""))
+    return ""
+
+
+def scenarios() -> Dict[str, Tuple[str, Dict[str, str], bool]]:
+    """name -> (script, query params, click the first button)."""
+    out = {name: (r.script, {}, False) for name, r in ROUTES.items()}
+    pid = lab_project()
+    if pid:
+        out["lab"] = (ROUTES["lab"].script, {"project": pid}, False)
+        out["lab_run"] = (ROUTES["lab"].script, {"project": pid}, True)  # after "Keep it simple"
+    return out
+
+
+# =========================
+# Element sizes
+# =========================
+def leaves(node: Any) -> Iterator[Any]:
+    kids = getattr(node, "children", None)
+    if kids:
+        for child in kids.values():
+            yield from leaves(child)
+    elif getattr(node, "proto", None) is not None:
+        yield node
+
+
+def describe(proto: Any) -> Tuple[str, str]:
+    """(element kind, short preview of its content)."""
+    kind = type(proto).__name__
+    text = ""
+    for field in ("body", "srcdoc", "json_args", "label", "spec", "src", "url"):
+        value = getattr(proto, field, None)
+        if isinstance(value, str) and value:
+            text = value
+            break
+    text = DATA_URI.sub(b"data:...", text.encode("utf-8")).decode("utf-8")
+    return kind, " ".join(text.split())[:70]
+
+
+def measure(script: str, query: Dict[str, str], click: bool) -> List[Dict[str, Any]]:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / script), default_timeout=300)
+    for k, v in query.items():
+        at.query_params[k] = v
+    at.run()
+    if click and len(at.button):
+        at.button[0].click().run()
+    if at.exception:
+        raise RuntimeError(f"{script}: {at.exception[0].value}")
+
+    elements = []
+    for node in leaves(at._tree):
+        raw = node.proto.SerializeToString()
+        kind, preview = describe(node.proto)
+        inline = sum(len(m) for m in DATA_URI.findall(raw))
+        elements.append({"kind": kind, "bytes": len(raw), "inline_bytes": inline, "preview": preview})
+    return elements
+
+
+# =========================
+# Report
+# =========================
+def kb(n: float) -> str:
+    return f"{n / 1024:,.1f} KB"
+
+
+def report(name: str, elements: List[Dict[str, Any]], budget_kb: Optional[float], top: int) -> Dict[str, Any]:
+    total = sum(e["bytes"] for e in elements)
+    inline = sum(e["inline_bytes"] for e in elements)
+    over = budget_kb is not None and total > budget_kb * 1024
+    by_kind: Dict[str, List[int]] = {}
+    for e in elements:
+        entry = by_kind.setdefault(e["kind"], [0, 0])
+        entry[0] += 1
+        entry[1] += e["bytes"]
+
+    status = "no budget" if budget_kb is None else ("OVER" if over else "ok")
+    limit = "" if budget_kb is None else f" / {budget_kb:,.0f} KB"
+    print(f"\n== {name}: {kb(total)}{limit}  [{status}]  ({len(elements)} elements, inline data: URIs {kb(inline)})")
+    for kind, (n, size) in sorted(by_kind.items(), key=lambda kv: -kv[1][1]):
+        print(f"   {kind:<22} {n:>4} x  {kb(size):>12}")
+    print("   largest:")
+    for e in sorted(elements, key=lambda e: -e["bytes"])[:top]:
+        print(f"   {kb(e['bytes']):>12}  {e['kind']:<18} {e['preview']}")
+
+    return {"total_bytes": total, "inline_bytes": inline, "budget_kb": budget_kb, "over": over, "elements": elements}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    known = scenarios()
+    ap.add_argument("--pages", nargs="+", choices=list(known), default=list(known))
+    ap.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS)
+    ap.add_argument("--top", type=int, default=5, help="largest elements listed per page")
+    ap.add_argument("--json", type=Path, help="also write the full report here")
+    args = ap.parse_args()
+
+    budgets: Dict[str, float] = json.loads(args.budgets.read_text(encoding="utf-8")) if args.budgets.exists() else {}
+    results = {}
+    for name in args.pages:
+        script, query, click = known[name]
+        results[name] = report(name, measure(script, query, click), budgets.get(name), args.top)
+
+    over = [name for name, r in results.items() if r["over"]]
+    print("\n" + (f"over budget: {', '.join(over)}" if over else "all pages within budget"))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if over:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Cold start per entry point: import cost by module / package and first-run time.
+
+    python benchmarks/coldstart.py [--entries router lab ...] [--repeat 3] [--top 8]
+                                   [--budget benchmarks/coldstart_budget.json] [--record]
+
+Every entry point (the router, Command_Center.py, and each route script of
+src/nav.py) runs once in a fresh interpreter under `python -X importtime`: Streamlit
+and AppTest are imported first (the baseline every page pays anyway), then the
+script's first run is timed and the imports it triggers are attributed to it.
+
+Reported per entry: first-run ms (imports included), import ms, new modules and
+the most expensive top-level packages. Then, for the router: packages it imports
+at startup that the home page itself doesn't need, and the pages that import them
+(candidates for lazy imports).
+
+Budgets per entry live in coldstart_budget.json next to this script: first-run ms,
+about 5x the fastest medians in the history (about 2x those of the slowest machine
+recorded so far), and the number of new modules, which doesn't depend on the
+machine and is what catches a heavy import creeping back into the router or a
+light page. The exit code is 1 if an entry is over either. --record appends the
+results, with the current commit, to coldstart_history.jsonl to track them over time.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BUDGET = Path(__file__).with_name("coldstart_budget.json")
+HISTORY = Path(__file__).with_name("coldstart_history.jsonl")
+
+MARKER = "--- coldstart: entry point ---"
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$")
+MIN_PACKAGE_MS = 5.0  # smaller packages are left out of the router-vs-home list
+
+
+def entries() -> Dict[str, str]:
+    sys.path.insert(0, str(ROOT))
+    logging.disable(logging.WARNING)  # Streamlit's bare-mode cache warnings on import
+    from src.nav import ROUTES
+
+    return {"router": "Command_Center.py", **{name: r.script for name, r in ROUTES.items()}}
+
+
+# =========================
+# Child process (one entry, fresh interpreter)
+# =========================
+def child(script: str) -> None:
+    from streamlit.testing.v1 import AppTest  # baseline: paid by every entry
+
+    print(MARKER, file=sys.stderr, flush=True)
+    t0 = time.perf_counter()
+    at = AppTest.from_file(str(ROOT / script), default_timeout=120)
+    at.run()
+    ms = (time.perf_counter() - t0) * 1000.0
+    sys.stderr.flush()
+    print(json.dumps({"first_run_ms": ms, "exception": bool(at.exception)}))
+
+
+def run_entry(script: str) -> Dict[str, Any]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, "--child", script],
+        cwd=ROOT, env={**os.environ, "PYTHONPATH": str(ROOT)}, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    modules: Dict[str, Dict[str, float]] = {}
+    after = False
+    for line in proc.stderr.splitlines():
+        if line.strip() == MARKER:
+            after = True
+            continue
+        m = IMPORT_LINE.match(line)
+        if after and m:
+            self_us, cum_us, indent, name = int(m.group(1)), int(m.group(2)), len(m.group(3)), m.group(4)
+            modules[name] = {"self_ms": self_us / 1000.0, "cum_ms": cum_us / 1000.0, "top": indent <= 1}
+    result["import_ms"] = sum(m["cum_ms"] for m in modules.values() if m["top"])
+    result["modules"] = modules
+    return result
+
+
+def packages(modules: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """Self import time summed by top-level package (src.* kept per module)."""
+    out: Dict[str, float] = {}
+    for name, m in modules.items():
+        pkg = name if name.startswith("src.") else name.split(".")[0]
+        out[pkg] = out.get(pkg, 0.0) + m["self_ms"]
+    return out
+
+
+# =========================
+# Report
+# =========================
+def measure(names: List[str], known: Dict[str, str], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name in names:
+        runs = sorted((run_entry(known[name]) for _ in range(repeat)), key=lambda r: r["first_run_ms"])
+        results[name] = runs[len(runs) // 2]  # median run
+    return results
+
+
+def report(results: Dict[str, Dict[str, Any]], budgets: Dict[str, Dict[str, float]], top: int) -> List[str]:
+    over = []
+    print(f"{'entry':<10} {'first run':>10} {'imports':>9} {'modules':>8}  top packages (self ms)")
+    for name, r in results.items():
+        pk = sorted(packages(r["modules"]).items(), key=lambda kv: -kv[1])[:top]
+        budget = budgets.get(name, {})
+        flag = ""
+        if "first_run_ms" in budget and r["first_run_ms"] > budget["first_run_ms"]:
+            flag += f"  OVER {budget['first_run_ms']:.0f} ms"
+        if "modules" in budget and len(r["modules"]) > budget["modules"]:
+            flag += f"  OVER {budget['modules']} modules"
+        if flag:
+            over.append(name)
+        err = "  (page raised)" if r["exception"] else ""
+        print(
+            f"{name:<10} {r['first_run_ms']:>7.0f} ms {r['import_ms']:>6.0f} ms {len(r['modules']):>8}  "
+            + ", ".join(f"{p} {ms:.0f}" for p, ms in pk) + flag + err
+        )
+
+    if "router" in results and "home" in results:
+        home: Set[str] = set(packages(results["home"]["modules"]))
+        extra = {p: ms for p, ms in packages(results["router"]["modules"]).items() if p not in home and ms >= MIN_PACKAGE_MS}
+        if extra:
+            print("\nimported by the router at startup, not needed by home:")
+            for pkg, ms in sorted(extra.items(), key=lambda kv: -kv[1]):
+                users = [n for n, r in results.items() if n not in ("router", "home") and pkg in packages(r["modules"])]
+                print(f"  {pkg:<28} {ms:>7.0f} ms  imported by: {', '.join(users) or '-'}")
+    return over
+
+
+def record(results: Dict[str, Dict[str, Any]], path: Path = HISTORY) -> None:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    row = {
+        "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "entries": {
+            n: {"first_run_ms": round(r["first_run_ms"], 1), "import_ms": round(r["import_ms"], 1), "modules": len(r["modules"])}
+            for n, r in results.items()
+        },
+    }
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(row) + "\n")
+
+
+def main() -> None:
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        return child(sys.argv[2])
+
+    known = entries()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--entries", nargs="+", choices=list(known), default=list(known))
+    ap.add_argument("--repeat", type=int, default=3, help="fresh interpreters per entry (median kept)")
+    ap.add_argument("--top", type=int, default=8, help="packages listed per entry")
+    ap.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    ap.add_argument("--record", action="store_true", help=f"append the results to {HISTORY.name}")
+    args = ap.parse_args()
+
+    budgets = json.loads(args.budget.read_text(encoding="utf-8")) if args.budget.exists() else {}
+    results = measure(args.entries, known, args.repeat)
+    over = report(results, budgets, args.top)
+    if args.record:
+        record(results)
+    if over:
+        print(f"\nover budget: {', '.join(over)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import streamlit as st
+
+from src.brand import STATIC_DIR, STATIC_URL
+from src.loaders import file_fingerprint
+from src.metrics import counted
+from src.perf import timed
+
+
+# =========================
+# Static files (no pandas / ML imports: light pages use this module)
+# =========================
+@counted(st.cache_resource)
+def _asset_bytes(path: str, fingerprint: str) -> Tuple[bytes, str]:
+    data = Path(path).read_bytes()
+    return data, hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def asset_bytes(path: Path) -> Tuple[bytes, str]:
+    """
+    (bytes, etag) of a static file, read once per file version and shared by every
+    session (cache_resource: no per-call copy). (b"", "") if the file is missing.
+    """
+    fp = file_fingerprint(path)
+    return _asset_bytes(str(path), fp) if fp else (b"", "")
+
+
+# =========================
+# Project covers (served from static/covers/, not inlined)
+# =========================
+# Cards show covers 150 px high at up to ~560 px wide; 960 px keeps them sharp on 2x screens
+COVER_PX = 960
+
+_covers_lock = threading.Lock()
+_covers: Dict[Tuple[str, str, str], Path] = {}
+
+
+def resolve_cover(cover: str, root: Path) -> Optional[Path]:
+    """
+    cover can be a repo-relative path (assets/covers/x.png) or just a file name,
+    assumed inside assets/ or assets/covers/.
+    """
+    candidates = [root / cover, root / "assets" / cover, root / "assets" / "covers" / cover]
+    return next((p for p in candidates if p.is_file()), None)
+
+
+def _cover_bytes(src: Path, px: int) -> bytes:
+    """Cover downscaled to fit px × px, same format; the original if that isn't smaller."""
+    data = src.read_bytes()
+    try:
+        from PIL import Image
+    except ImportError:  # Pillow missing: serve the original bytes
+        return data
+
+    try:
+        with Image.open(io.BytesIO(data)) as im:
+            if getattr(im, "is_animated", False) or im.format not in ("PNG", "JPEG", "WEBP"):
+                return data
+            fmt = im.format
+            im.thumbnail((px, px), Image.LANCZOS)
+            buf = io.BytesIO()
+            im.save(buf, fmt, optimize=True)
+    except OSError:  # unreadable image: let the browser deal with the original
+        return data
+    out = buf.getvalue()
+    return out if len(out) < len(data) else data
+
+
+def cover_file(src: Path, static_dir: Path = STATIC_DIR, px: int = COVER_PX) -> Path:
+    """
+    Web-sized copy of a cover in <static_dir>/covers/, built once per process and
+    source version. The file name carries a hash of the source path (two projects'
+    cover.png never share a name) and a content hash (safe to cache forever).
+    """
+    key = (str(src), file_fingerprint(src), str(static_dir))
+    with _covers_lock:
+        out = _covers.get(key)
+        if out is not None and out.exists():
+            return out
+
+        data = _cover_bytes(src, px)
+        source = hashlib.blake2b(str(src.resolve()).encode("utf-8"), digest_size=4).hexdigest()
+        prefix = f"{src.stem}-{source}"
+        suffix = src.suffix.lower()
+        digest = hashlib.blake2b(data, digest_size=6).hexdigest()
+        covers = static_dir / "covers"
+        out = covers / f"{prefix}-{digest}{suffix}"
+        if not out.exists():
+            covers.mkdir(parents=True, exist_ok=True)
+            tmp = out.with_name(out.name + ".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(out)
+            # older versions of this same source only
+            for old in covers.glob(f"{prefix}-*{suffix}"):
+                if old != out and old.stem.rsplit("-", 1)[0] == prefix:
+                    old.unlink(missing_ok=True)
+        _covers[key] = out
+        return out
+
+
+def cover_url(cover: str, root: Path) -> str:
+    """
+    URL of a project cover (remote URL as is, local file via <root>/static/covers/);
+    "" if not found. The cover is looked up under root.
+    """
+    cover = (cover or "").strip()
+    if not cover:
+        return ""
+    if cover.startswith("http://") or cover.startswith("https://"):
+        return cover
+    img_path = resolve_cover(cover, root)
+    if img_path is None:
+        return ""  # fail silently
+    static_dir = root / "static"
+    return f"{STATIC_URL}/{cover_file(img_path, static_dir).relative_to(static_dir).as_posix()}"
+
+
+@timed()
+def cover_img_tag(cover: str, root: Path) -> str:
+    """<img class='cover'> for a project cover; "" if it can't be found."""
+    url = cover_url(cover, root)
+    if not url:
+        return ""
+    return f"<img class='cover' src='{url}' alt='cover' loading='lazy'/>"
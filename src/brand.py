@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+from src.loaders import file_fingerprint
+
+
+ROOT = Path(__file__).resolve().parents[1]
+LOGO_PATH = ROOT / "assets" / "wizard_FN.png"
+
+# Streamlit static serving (server.enableStaticServing): ROOT/static/x → app/static/x
+STATIC_DIR = ROOT / "static"
+BRAND_DIR = STATIC_DIR / "brand"
+STATIC_URL = "app/static"
+
+# Largest on-screen use is 34 px (topbars / hero); 96 px keeps it sharp on 2-3x screens
+LOGO_PX = 96
+
+_lock = threading.Lock()
+_built: Dict[Tuple[str, int], Path] = {}
+
+
+def _thumbnail_png(src: Path, px: int) -> bytes:
+    try:
+        from PIL import Image
+    except ImportError:  # Pillow missing: serve the original bytes
+        return src.read_bytes()
+
+    with Image.open(src) as im:
+        im = im.convert("RGBA" if "A" in im.getbands() else "RGB")
+        im.thumbnail((px, px), Image.LANCZOS)
+        buf = io.BytesIO()
+        im.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
+def logo_file(px: int = LOGO_PX, src: Path = LOGO_PATH) -> Path | None:
+    """
+    Optimized square logo variant in static/brand/, built once per process and
+    source version. The file name carries a content hash (safe to cache forever).
+    None if the source logo is missing.
+    """
+    fp = file_fingerprint(src)
+    if not fp:
+        return None
+    key = (fp, px)
+    with _lock:
+        out = _built.get(key)
+        if out is not None and out.exists():
+            return out
+
+        data = _thumbnail_png(src, px)
+        digest = hashlib.blake2b(data, digest_size=6).hexdigest()
+        out = BRAND_DIR / f"{src.stem}-{px}-{digest}.png"
+        if not out.exists():
+            BRAND_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = out.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(out)
+            for old in BRAND_DIR.glob(f"{src.stem}-{px}-*.png"):
+                if old != out:
+                    old.unlink(missing_ok=True)
+        _built[key] = out
+        return out
+
+
+def logo_url(px: int = LOGO_PX) -> str:
+    """Relative URL of the logo variant ("" if there is no logo)."""
+    path = logo_file(px)
+    if path is None:
+        return ""
+    return f"{STATIC_URL}/{path.relative_to(STATIC_DIR).as_posix()}"
+
+
+def logo_img(cls: str = "", alt: str = "logo", px: int = LOGO_PX) -> str:
+    """<img> tag for the logo ("" if there is no logo)."""
+    url = logo_url(px)
+    if not url:
+        return ""
+    cls_attr = f" class='{cls}'" if cls else ""
+    return f"<img{cls_attr} alt='{alt}' src='{url}' />"
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import streamlit as st
+
+from src.loaders import file_fingerprint, load_projects, load_yaml
+from src.metrics import LAB_TRAIN_SECONDS, counted
+from src.perf import timer
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.forecast import RecursiveForecaster
+
+
+# =========================
+# Shared caches (pages + warming service)
+# =========================
+# Defined in a real module (not in a page script) so the warmer thread fills the
+# exact same cache entries the pages read. Every key carries the file fingerprint:
+# editing an asset invalidates its entries without a restart.
+# pandas and the Lab pipeline (scikit-learn, scipy) are imported inside the Lab
+# functions, so Projects and the router don't pay for them on import.
+
+
+@counted(st.cache_data)
+def _catalog(path: str, fingerprint: str) -> List[Dict[str, Any]]:
+    return load_projects(Path(path))
+
+
+def catalog(path: Path) -> List[Dict[str, Any]]:
+    """Cleaned project list (src.loaders.load_projects) of data/projects.yaml."""
+    return _catalog(str(path), file_fingerprint(path))
+
+
+@counted(st.cache_data)
+def _catalog_raw(path: str, fingerprint: str) -> List[Dict[str, Any]]:
+    projects = load_yaml(Path(path)).get("projects", [])
+    return projects if isinstance(projects, list) else []
+
+
+def catalog_raw(path: Path) -> List[Dict[str, Any]]:
+    """Project entries exactly as written in the YAML (the Lab reads its own keys)."""
+    return _catalog_raw(str(path), file_fingerprint(path))
+
+
+SEARCH_FIELDS = (
+    "title", "tagline", "industry", "type", "status", "year", "impact_type",
+    "skills", "tools", "outcomes", "problem", "approach", "results", "details",
+)
+FACETS = ("industry", "type", "status", "impact_type")
+
+
+@counted(st.cache_data)
+def _search_index(path: str, fingerprint: str) -> Dict[str, Any]:
+    projects = _catalog(path, fingerprint)  # built on the cached catalog: the YAML is parsed once
+    haystack = []
+    for p in projects:
+        parts = [" ".join(v) if isinstance(v, list) else str(v or "") for v in (p.get(f) for f in SEARCH_FIELDS)]
+        haystack.append(" ".join(parts).lower())
+    facets = {f: sorted({p.get(f, "") for p in projects if p.get(f)}) for f in FACETS}
+    return {"haystack": haystack, "facets": facets}
+
+
+def search_index(path: Path) -> Dict[str, Any]:
+    """
+    Projects search: lowercase haystack per catalog entry (same order as catalog())
+    and the sorted values of each filter facet.
+    """
+    return _search_index(str(path), file_fingerprint(path))
+
+
+# =========================
+# Lab demo assets
+# =========================
+@counted(st.cache_data)
+def load_csv(path: str, fingerprint: str) -> pd.DataFrame:
+    import pandas as pd
+
+    with timer("load_csv"):
+        return pd.read_csv(path)
+
+
+# Profile once per asset version (shared by KPIs + df.info panel)
+@counted(st.cache_data)
+def profile_asset(path: str, fingerprint: str) -> dict:
+    from src.profiling import profile_frame
+
+    df = load_csv(path, fingerprint)
+    with timer("profile_frame"):
+        return profile_frame(df)
+
+
+# Train once per asset version; models stay in memory for forecasting.
+# _n_jobs is not part of the key (leading underscore): it only changes training speed.
+@counted(st.cache_resource)
+def train_lab(path: str, fingerprint: str, _n_jobs: int = -1) -> dict:
+    from src.lab_pipeline import run_demo
+
+    df = load_csv(path, fingerprint)
+    t0 = time.perf_counter()
+    result = run_demo(df, n_jobs=_n_jobs)
+    LAB_TRAIN_SECONDS.observe(time.perf_counter() - t0, dataset=Path(path).name)
+    return result
+
+
+@counted(st.cache_resource)
+def forecaster(path: str, fingerprint: str) -> Optional[RecursiveForecaster]:
+    from src.forecast import RecursiveForecaster
+
+    result = train_lab(path, fingerprint)
+    if not result.get("ok"):
+        return None
+    return RecursiveForecaster(
+        result["best_model"],
+        result["ts"],
+        max_lag=result["max_lag"],
+        roll=result["roll"],
+        residual_std=result["residual_std"],
+    )
+
+
+@counted(st.cache_data)
+def forecast(path: str, fingerprint: str, horizon: int, level: float) -> pd.DataFrame:
+    return forecaster(path, fingerprint).forecast(horizon, level=level)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from src import metrics
+
+
+# Default point budget for interactive series: keeps the JSON payload roughly
+# constant (~tens of KB) no matter how long the history is.
+MAX_POINTS = 1500
+
+# Process-wide figure cache (shared by every session): key -> built go.Figure.
+# Cached figures are shared read-only: st.plotly_chart only reads them (to_dict),
+# callers must not update them in place.
+FIGURE_CACHE_SIZE = 64
+_figure_cache: "OrderedDict[str, go.Figure]" = OrderedDict()
+_figure_lock = threading.Lock()
+FIGURE_CACHE_HITS = metrics.counter("portfolio_figure_cache_hits_total", "Plotly figure LRU cache hits.")
+FIGURE_CACHE_MISSES = metrics.counter("portfolio_figure_cache_misses_total", "Plotly figure LRU cache misses (figure built).")
+
+
+def _as_float_axis(x: np.ndarray) -> np.ndarray:
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the positional indices of the points to keep (first and last are always kept).
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    xf = _as_float_axis(np.asarray(x))
+    yf = np.asarray(y, dtype=float)
+
+    # n_out - 2 buckets between the fixed first/last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # average of the next bucket (the last bucket looks at the final point)
+        nlo = hi
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xf[nlo:nhi].mean()
+        avg_y = yf[nlo:nhi].mean()
+
+        area = np.abs(
+            (xf[a] - avg_x) * (yf[lo:hi] - yf[a])
+            - (xf[a] - xf[lo:hi]) * (avg_y - yf[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+
+    return keep
+
+
+def downsample_series(ts: pd.Series, max_points: int = MAX_POINTS) -> pd.Series:
+    if len(ts) <= max_points:
+        return ts
+    idx = lttb_indices(ts.index.values, ts.values, max_points)
+    return ts.iloc[idx]
+
+
+def series_figure(
+    ts: pd.Series,
+    title: str = "Hourly demand",
+    max_points: int = MAX_POINTS,
+    window: Optional[pd.Timedelta] = pd.Timedelta(days=21),
+) -> go.Figure:
+    """
+    Interactive time-series view.
+    The full history is LTTB-downsampled to `max_points`; the initial zoom shows the last `window`.
+    """
+    view = downsample_series(ts, max_points=max_points)
+
+    fig = go.Figure(
+        go.Scatter(
+            x=view.index,
+            y=view.values,
+            mode="lines",
+            line={"width": 1.4, "color": "rgba(255,255,255,.85)"},
+            hovertemplate="%{x}<br>%{y:,.0f}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title={"text": title, "font": {"size": 13}},
+        template="plotly_dark",
+        height=320,
+        margin={"l": 10, "r": 10, "t": 40, "b": 10},
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+    )
+    fig.update_xaxes(
+        showgrid=True,
+        gridcolor="rgba(255,255,255,.08)",
+        rangeslider={"visible": True, "thickness": 0.08},
+    )
+    fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,.08)")
+
+    if window is not None and len(ts) and isinstance(ts.index, pd.DatetimeIndex):
+        end = ts.index[-1]
+        start = max(ts.index[0], end - window)
+        fig.update_xaxes(range=[start, end])
+
+    return fig
+
+
+# =========================
+# Figure cache (keyed by data hash + plot params)
+# =========================
+def series_hash(ts: pd.Series) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(ts, index=True).values.tobytes())
+    h.update(str(ts.name).encode("utf-8"))
+    return h.hexdigest()
+
+
+def cached_series_figure(
+    ts: pd.Series,
+    title: str = "Hourly demand",
+    max_points: int = MAX_POINTS,
+    window: Optional[pd.Timedelta] = pd.Timedelta(days=21),
+    data_hash: Optional[str] = None,
+) -> go.Figure:
+    """
+    Same as series_figure, but the figure is built once per key and reused across
+    reruns and sessions (the returned figure is shared: treat it as read-only).
+    Pass `data_hash` (from series_hash) when the caller already has it, to skip re-hashing.
+    """
+    key = "|".join([data_hash or series_hash(ts), title, str(max_points), str(window)])
+
+    with _figure_lock:
+        fig = _figure_cache.get(key)
+        if fig is not None:
+            _figure_cache.move_to_end(key)
+            FIGURE_CACHE_HITS.inc()
+            return fig
+
+    fig = series_figure(ts, title=title, max_points=max_points, window=window)
+    with _figure_lock:
+        FIGURE_CACHE_MISSES.inc()
+        _figure_cache[key] = fig
+        while len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+    return fig
+
+
+def figure_cache_stats() -> Dict[str, int]:
+    with _figure_lock:
+        size = len(_figure_cache)
+    return {"hits": int(FIGURE_CACHE_HITS.value()), "misses": int(FIGURE_CACHE_MISSES.value()), "size": size}
+
+
+metrics.gauge(
+    "portfolio_figure_cache_entries",
+    "Plotly figure LRU cache: current number of entries.",
+    lambda: {metrics.labels(): figure_cache_stats()["size"]},
+)
+
+
+def forecast_figure(history: pd.Series, fc: pd.DataFrame, title: str = "Forecast") -> go.Figure:
+    """
+    Recent actuals + recursive forecast with its prediction band.
+    `fc` is the frame returned by RecursiveForecaster.forecast (yhat / lo / hi).
+    """
+    hist = downsample_series(history)
+    band_x = list(fc.index) + list(fc.index[::-1])
+    band_y = list(fc["hi"].values) + list(fc["lo"].values[::-1])
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=hist.index, y=hist.values, mode="lines", name="actual",
+            line={"width": 1.4, "color": "rgba(255,255,255,.85)"},
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=band_x, y=band_y, fill="toself", name="interval", hoverinfo="skip",
+            fillcolor="rgba(255,80,90,.16)", line={"width": 0},
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=fc.index, y=fc["yhat"].values, mode="lines", name="forecast",
+            line={"width": 1.8, "color": "rgba(255,80,90,.95)"},
+        )
+    )
+    fig.update_layout(
+        title={"text": title, "font": {"size": 13}},
+        template="plotly_dark",
+        height=320,
+        margin={"l": 10, "r": 10, "t": 40, "b": 10},
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        legend={"orientation": "h", "y": 1.08, "x": 1, "xanchor": "right"},
+    )
+    fig.update_xaxes(showgrid=True, gridcolor="rgba(255,255,255,.08)")
+    fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,.08)")
+    return fig
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.lab_pipeline import MAX_LAG, ROLL
+
+
+class RecursiveForecaster:
+    """
+    H-step-ahead hourly forecaster on top of a fitted Lab model.
+
+    The feature state (last max(lag, roll) values in a ring buffer, the running
+    rolling-window sum and the last timestamp) is built once from the history and
+    reused by every forecast() call. Each step writes the prediction back into a
+    copy of that buffer and fills a preallocated feature row, so no DataFrame is
+    rebuilt per step. Row layout matches lab_pipeline.feature_names().
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        history: pd.Series,
+        max_lag: int = MAX_LAG,
+        roll: int = ROLL,
+        residual_std: float = 0.0,
+    ):
+        if len(history) < max(max_lag, roll):
+            raise ValueError(f"Need at least {max(max_lag, roll)} hourly points, got {len(history)}.")
+
+        self.model = model
+        self.max_lag = max_lag
+        self.roll = roll
+        self.residual_std = float(residual_std)
+        self.nonnegative = bool((history >= 0).all())
+
+        self._window = max(max_lag, roll)
+        values = history.to_numpy(dtype=float)
+        self._buf = values[-self._window:].copy()
+        self._roll_sum = float(values[-roll:].sum())
+        self._last_ts = pd.Timestamp(history.index[-1])
+        self._n_features = 5 + max_lag + 1
+
+    def forecast(self, horizon: int, level: float = 0.8) -> pd.DataFrame:
+        """
+        Returns one row per step: yhat, lo, hi (normal interval at `level`, widening
+        with sqrt(step)) and latency_ms (wall time of that step).
+        """
+        horizon = int(horizon)
+        buf = self._buf.copy()
+        pos = 0  # next write slot == oldest value
+        roll_sum = self._roll_sum
+        W, L, R = self._window, self.max_lag, self.roll
+
+        index = pd.date_range(self._last_ts + pd.Timedelta(hours=1), periods=horizon, freq="h")
+        # Calendar columns for the whole horizon in one shot
+        cal = np.column_stack(
+            [index.year, index.month, index.day, index.hour, index.dayofweek]
+        ).astype(float)
+
+        row = np.empty((1, self._n_features), dtype=float)
+        lag_slots = np.arange(1, L + 1)
+        yhat = np.empty(horizon, dtype=float)
+        latency = np.empty(horizon, dtype=float)
+
+        predict = self.model.predict
+        for step in range(horizon):
+            t0 = time.perf_counter()
+            row[0, :5] = cal[step]
+            row[0, 5 : 5 + L] = buf[(pos - lag_slots) % W]
+            row[0, -1] = roll_sum / R
+
+            y = float(predict(row)[0])
+            if self.nonnegative and y < 0:
+                y = 0.0
+            yhat[step] = y
+
+            # slide the window: value leaving the rolling mean, then overwrite the oldest slot
+            roll_sum += y - buf[(pos - R) % W]
+            buf[pos] = y
+            pos = (pos + 1) % W
+            latency[step] = (time.perf_counter() - t0) * 1000.0
+
+        z = NormalDist().inv_cdf(0.5 + level / 2.0)
+        half = z * self.residual_std * np.sqrt(np.arange(1, horizon + 1))
+        lo = yhat - half
+        if self.nonnegative:
+            lo = np.maximum(lo, 0.0)
+
+        return pd.DataFrame(
+            {"yhat": yhat, "lo": lo, "hi": yhat + half, "latency_ms": latency},
+            index=index,
+        )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import streamlit.components.v1 as components
+
+from src.loaders import file_fingerprint
+from src.theme import minify_css
+
+
+TEMPLATE_PATH = Path(__file__).with_name("hero.html")
+
+VIDEO_MIME = {".webm": "video/webm", ".mp4": "video/mp4"}
+
+_build_lock = threading.Lock()
+_builds: Dict[str, Path] = {}
+
+
+def asset_manifest(logo: Optional[Path], videos: List[Path]) -> Dict[str, str]:
+    """
+    name -> fingerprint of every file the hero shell depends on.
+    The first existing video wins (same order as the candidates list).
+    """
+    manifest = {"template": file_fingerprint(TEMPLATE_PATH)}
+    if logo is not None and logo.exists():
+        manifest["logo"] = f"{logo}:{file_fingerprint(logo)}"
+    video = next((v for v in videos if v.exists()), None)
+    if video is not None:
+        manifest["video"] = f"{video}:{file_fingerprint(video)}"
+    return manifest
+
+
+def manifest_version(manifest: Dict[str, str]) -> str:
+    h = hashlib.blake2b(digest_size=6)
+    for k in sorted(manifest):
+        h.update(f"{k}={manifest[k]};".encode("utf-8"))
+    return h.hexdigest()
+
+
+# =========================
+# Minify (conservative: no JS parsing)
+# =========================
+def _minify_js(js: str) -> str:
+    # keep line breaks (ASI) and only drop indentation, blank lines and whole-line comments
+    out = []
+    for line in js.split("\n"):
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        out.append(line)
+    return "\n".join(out)
+
+
+def minify_html(html: str) -> str:
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    html = re.sub(
+        r"(<style[^>]*>)(.*?)(</style>)",
+        lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3),
+        html,
+        flags=re.S,
+    )
+    html = re.sub(
+        r"(<script[^>]*>)(.*?)(</script>)",
+        lambda m: m.group(1) + _minify_js(m.group(2)) + m.group(3),
+        html,
+        flags=re.S,
+    )
+    # markup outside <script>/<style>: collapse the indentation between tags
+    parts = re.split(r"(<script[^>]*>.*?</script>|<style[^>]*>.*?</style>)", html, flags=re.S)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r">\s+<", "><", re.sub(r"\n\s*", "\n", parts[i]))
+    return "".join(parts).strip()
+
+
+# =========================
+# Build (once per manifest version)
+# =========================
+def _link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def build_hero(build_root: Path, logo: Optional[Path], videos: List[Path]) -> Tuple[Path, str]:
+    """
+    Renders the hero shell into build_root/<version>/index.html, next to the logo
+    and background video it references by relative URL (no base64 inlining).
+    Built once per asset-manifest version and process; older versions are removed.
+    Returns (build_dir, version).
+    """
+    manifest = asset_manifest(logo, videos)
+    version = manifest_version(manifest)
+
+    with _build_lock:
+        if version in _builds and _builds[version].exists():
+            return _builds[version], version
+
+        out = build_root / version
+        tmp = build_root / f".{version}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        brand_img = ""
+        if "logo" in manifest:
+            _link_or_copy(logo, tmp / f"logo{logo.suffix}")
+            brand_img = f"<img alt='logo' src='logo{logo.suffix}' />"
+
+        video_tag = """<div class="bgsolid"></div>"""
+        video: Optional[Path] = next((v for v in videos if v.exists()), None)
+        if video is not None:
+            _link_or_copy(video, tmp / f"bg{video.suffix}")
+            mime = VIDEO_MIME.get(video.suffix.lower(), "video/mp4")
+            video_tag = f"""
+    <video class="bgvideo" autoplay muted loop playsinline preload="auto">
+      <source src="bg{video.suffix}" type="{mime}">
+    </video>
+    """
+
+        html = TEMPLATE_PATH.read_text(encoding="utf-8")
+        html = html.replace("__VIDEO_TAG__", video_tag).replace("__BRAND_IMG__", brand_img)
+        data = minify_html(html).encode("utf-8")
+        (tmp / "index.html").write_bytes(data)
+
+        shutil.rmtree(out, ignore_errors=True)
+        tmp.rename(out)
+
+        for old in build_root.iterdir():
+            if old.is_dir() and old.name != version and not old.name.startswith("."):
+                shutil.rmtree(old, ignore_errors=True)
+
+        _builds.clear()
+        _builds[version] = out
+        return out, version
+
+
+def hero_component(build_root: Path, logo: Optional[Path], videos: List[Path]) -> Callable[..., Any]:
+    """
+    Static component serving the built shell. Declared here (a real module) rather than
+    in the page script: pages run by st.navigation have no importable module name.
+    """
+    hero_dir, version = build_hero(build_root, logo, videos)
+    return components.declare_component(f"hero_{version}", path=str(hero_dir))
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error
+
+from src.perf import timed, timer
+
+
+MAX_LAG = 24
+ROLL = 24
+TRAIN_FRAC = 0.9
+
+
+# =========================
+# Time-series demo helpers
+# =========================
+def infer_datetime_col(df: pd.DataFrame) -> str | None:
+    # Prefer common names
+    candidates = ["datetime", "date", "timestamp", "time"]
+    cols = [c for c in df.columns]
+    for name in candidates:
+        for c in cols:
+            if name in str(c).lower():
+                try:
+                    pd.to_datetime(df[c], errors="raise")
+                    return c
+                except Exception:
+                    pass
+    # fallback: try any col
+    for c in cols:
+        try:
+            pd.to_datetime(df[c], errors="raise")
+            return c
+        except Exception:
+            continue
+    return None
+
+
+def infer_target_col(df: pd.DataFrame) -> str | None:
+    # Your typical taxi dataset uses num_orders
+    preferred = ["num_orders", "demand", "demand_units", "target"]
+    for c in preferred:
+        if c in df.columns:
+            return c
+    # fallback: first numeric column
+    num_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    return num_cols[0] if num_cols else None
+
+
+@timed()
+def hourly_series(df: pd.DataFrame, dt_col: str, y_col: str) -> pd.Series:
+    df = df[[dt_col, y_col]].copy()
+    df[dt_col] = pd.to_datetime(df[dt_col], errors="coerce")
+    df = df.dropna(subset=[dt_col])
+    df = df.sort_values(dt_col)
+    return df.set_index(dt_col)[y_col].resample("h").sum().astype(float)
+
+
+@timed()
+def make_features(ts: pd.Series, max_lag: int = MAX_LAG, roll: int = ROLL) -> pd.DataFrame:
+    """
+    ts: hourly series
+    returns dataframe with calendar + lag + rolling features + target y
+    """
+    df = pd.DataFrame({"y": ts})
+    idx = df.index
+
+    df["year"] = idx.year
+    df["month"] = idx.month
+    df["day"] = idx.day
+    df["hour"] = idx.hour
+    df["dayofweek"] = idx.dayofweek
+
+    for lag in range(1, max_lag + 1):
+        df[f"lag_{lag}"] = df["y"].shift(lag)
+
+    df[f"rolling_mean_{roll}"] = df["y"].shift(1).rolling(roll).mean()
+    df = df.dropna()
+    return df
+
+
+def feature_names(max_lag: int = MAX_LAG, roll: int = ROLL) -> List[str]:
+    """Column order produced by make_features (minus the target)."""
+    return (
+        ["year", "month", "day", "hour", "dayofweek"]
+        + [f"lag_{lag}" for lag in range(1, max_lag + 1)]
+        + [f"rolling_mean_{roll}"]
+    )
+
+
+def time_split(df: pd.DataFrame, train_frac: float = TRAIN_FRAC) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    cut = int(len(df) * train_frac)
+    train = df.iloc[:cut]
+    test = df.iloc[cut:]
+    return train, test
+
+
+def rmse(y_true, y_pred) -> float:
+    return float(np.sqrt(mean_squared_error(y_true, y_pred)))
+
+
+# =========================
+# Train + evaluate
+# =========================
+@timed()
+def run_demo(df: pd.DataFrame, max_lag: int = MAX_LAG, roll: int = ROLL, n_jobs: int = -1) -> Dict[str, Any]:
+    """
+    resample hourly -> lag/rolling/calendar features -> LR + RF -> holdout RMSE.
+    Returns a dict with ok/error, metrics, the hourly series and the fitted models.
+    Models are fitted on NumPy arrays (column order = feature_names) so they can
+    serve single rows without DataFrame construction. n_jobs: RF training cores
+    (the fitted forest is the same for any value: random_state is fixed).
+    """
+    dt_col = infer_datetime_col(df)
+    y_col = infer_target_col(df)
+    if not dt_col or not y_col:
+        return {"ok": False, "error": "Could not infer datetime column or target column."}
+
+    ts = hourly_series(df, dt_col, y_col)
+
+    # Feature engineering
+    feat = make_features(ts, max_lag=max_lag, roll=roll)
+    train, test = time_split(feat, train_frac=TRAIN_FRAC)
+    if len(train) < 2 or len(test) < 1:
+        return {"ok": False, "error": "Not enough hourly history to train and evaluate."}
+
+    cols = feature_names(max_lag, roll)
+    X_train = train[cols].to_numpy(dtype=float)
+    y_train = train["y"].to_numpy(dtype=float)
+    X_test = test[cols].to_numpy(dtype=float)
+    y_test = test["y"].to_numpy(dtype=float)
+
+    # Baseline: Linear Regression
+    lr = LinearRegression()
+    with timer("lr_fit"):
+        lr.fit(X_train, y_train)
+    pred_lr = lr.predict(X_test)
+    rmse_lr = rmse(y_test, pred_lr)
+
+    # Stronger: Random Forest (kept small for fast demo)
+    rf = RandomForestRegressor(
+        n_estimators=120,
+        random_state=42,
+        n_jobs=n_jobs,
+        max_depth=None,
+        min_samples_leaf=2,
+    )
+    with timer("rf_fit"):
+        rf.fit(X_train, y_train)
+    pred_rf = rf.predict(X_test)
+    rmse_rf = rmse(y_test, pred_rf)
+    # Serving predicts one row at a time: thread fan-out costs more than it saves
+    rf.set_params(n_jobs=1)
+
+    if rmse_rf <= rmse_lr:
+        best_name, best_rmse, best_model, best_pred = "Random Forest", rmse_rf, rf, pred_rf
+    else:
+        best_name, best_rmse, best_model, best_pred = "Linear Regression", rmse_lr, lr, pred_lr
+
+    return {
+        "ok": True,
+        "dt_col": dt_col,
+        "y_col": y_col,
+        "ts": ts,
+        "max_lag": max_lag,
+        "roll": roll,
+        "features": cols,
+        "rmse_lr": float(rmse_lr),
+        "rmse_rf": float(rmse_rf),
+        "best_name": best_name,
+        "best_rmse": float(best_rmse),
+        "residual_std": float(np.std(y_test - best_pred)) if len(y_test) > 1 else float(best_rmse),
+        "models": {"Linear Regression": lr, "Random Forest": rf},
+        "best_model": best_model,
+    }
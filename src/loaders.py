@@ -5,6 +5,8 @@ from typing import Any, Dict, List
 
 import yaml
 
+from src.perf import timed
+
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
@@ -14,6 +16,16 @@ def load_yaml(path: Path) -> Dict[str, Any]:
     return data if isinstance(data, dict) else {}
 
 
+def file_fingerprint(path: Path) -> str:
+    """
+    Cheap cache key for an on-disk asset: changes whenever the file is replaced or edited.
+    """
+    if not path.exists():
+        return ""
+    stat = path.stat()
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
 def _as_list(x: Any) -> List[str]:
     if isinstance(x, list):
         return [str(v).strip() for v in x if str(v).strip()]
@@ -27,6 +39,7 @@ def _as_dict(x: Any) -> Dict[str, Any]:
     return x if isinstance(x, dict) else {}
 
 
+@timed()
 def load_projects(path: Path) -> List[Dict[str, Any]]:
     """
     Reads data/projects.yaml.
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src import runlog
+
+# Prometheus-style in-process registry (no client library): counters, histograms and
+# callback gauges, rendered in the text exposition format. Exposed through a periodic
+# file dump (.cache/metrics.prom, e.g. for node_exporter's textfile collector) and
+# the ?debug=metrics view of the router.
+
+ROOT = Path(__file__).resolve().parents[1]
+METRICS_PATH = ROOT / ".cache" / "metrics.prom"
+DUMP_EVERY_S = 15.0
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# seconds; covers a cached rerun (ms) up to a cold Lab training run
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def labels(**kv: str) -> LabelKey:
+    """Label set as a hashable key (what Gauge callbacks return as dict keys)."""
+    return _key(kv)
+
+
+def _escape_label(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(key: LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+def _fmt_value(v: float) -> str:
+    v = float(v)
+    if math.isnan(v):
+        return "NaN"
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    return repr(v) if v != int(v) else str(int(v))
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name, self.help = name, help
+        self._lock = threading.Lock()
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        out += [f"{self.name}{_fmt_labels(k)} {_fmt_value(v)}" for k, v in items]
+        return out
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name, self.help = name, help
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label key -> [per-bucket counts (+Inf last), sum, count]
+        self._values: Dict[LabelKey, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, agg = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0, 0.0]))
+            counts[i] += 1
+            agg[0] += value
+            agg[1] += 1
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(_key(labels))
+            return int(entry[1][1]) if entry else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), list(a))) for k, (c, a) in self._values.items())
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, (counts, (total, n)) in items:
+            cum = 0
+            for le, c in zip(list(self.buckets) + [float("inf")], counts):
+                cum += c
+                out.append(f"{self.name}_bucket{_fmt_labels(key, [('le', _fmt_value(le))])} {cum}")
+            out.append(f"{self.name}_sum{_fmt_labels(key)} {_fmt_value(total)}")
+            out.append(f"{self.name}_count{_fmt_labels(key)} {int(n)}")
+        return out
+
+
+class Gauge:
+    """Read at render time from a callback returning {labels dict as tuple: value}."""
+
+    def __init__(self, name: str, help: str, fn: Callable[[], Dict[LabelKey, float]]):
+        self.name, self.help, self.fn = name, help, fn
+
+    def render(self) -> List[str]:
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        try:
+            values = self.fn()
+        except Exception:  # a broken callback must not break the whole export
+            return out
+        out += [f"{self.name}{_fmt_labels(k)} {_fmt_value(v)}" for k, v in sorted(values.items())]
+        return out
+
+
+# =========================
+# Registry
+# =========================
+_registry_lock = threading.Lock()
+_registry: Dict[str, object] = {}
+
+
+def _register(metric):
+    with _registry_lock:
+        existing = _registry.get(metric.name)
+        if existing is not None:
+            return existing
+        _registry[metric.name] = metric
+        return metric
+
+
+def counter(name: str, help: str) -> Counter:
+    return _register(Counter(name, help))
+
+
+def histogram(name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return _register(Histogram(name, help, buckets))
+
+
+def gauge(name: str, help: str, fn: Callable[[], Dict[LabelKey, float]]) -> Gauge:
+    return _register(Gauge(name, help, fn))
+
+
+def render() -> str:
+    """Whole registry in the Prometheus text exposition format."""
+    with _registry_lock:
+        metrics = [_registry[k] for k in sorted(_registry)]
+    lines: List[str] = []
+    for m in metrics:
+        lines += m.render()
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: Path = METRICS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(render(), encoding="utf-8")
+    tmp.replace(path)
+
+
+_dumper: Optional[threading.Thread] = None
+
+
+def start_dumper(path: Path = METRICS_PATH, every_s: float = DUMP_EVERY_S) -> None:
+    """Rewrites `path` every `every_s` seconds from a daemon thread (once per process)."""
+    global _dumper
+    with _registry_lock:
+        if _dumper is not None:
+            return
+
+        def loop() -> None:
+            while True:
+                try:
+                    dump(path)
+                except OSError:
+                    pass
+                time.sleep(every_s)
+
+        _dumper = threading.Thread(target=loop, name="metrics-dump", daemon=True)
+        _dumper.start()
+
+
+# =========================
+# App metrics
+# =========================
+SCRIPT_RUNS = counter("portfolio_script_runs_total", "Script runs (reruns included) by page.")
+PAGE_VIEWS = counter("portfolio_page_views_total", "Navigations to a page (first run of a page in a session).")
+PAGE_SECONDS = histogram("portfolio_page_seconds", "Page script body duration by page.")
+CACHE_CALLS = counter("portfolio_cache_calls_total", "Calls to shared st.cache_* functions by function.")
+CACHE_MISSES = counter("portfolio_cache_misses_total", "Cache misses (function body executed) by function.")
+# timed sections with PORTFOLIO_TRACEMALLOC (src.perf)
+MEM_BUCKETS = tuple(float(2**20 * mb) for mb in (1, 4, 16, 64, 256, 1024, 4096))
+STAGE_PEAK_BYTES = histogram(
+    "portfolio_stage_peak_bytes", "Peak traced allocation of a timed section above its start, by section (only sections that set a new process high).", MEM_BUCKETS
+)
+STAGE_RETAINED_BYTES = histogram(
+    "portfolio_stage_retained_bytes", "Traced allocation still held when a timed section ends, by section.", MEM_BUCKETS
+)
+LAB_TRAIN_SECONDS = histogram(
+    "portfolio_lab_train_seconds", "Lab training duration (LR + RF) by dataset.",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+def counted(cache: Callable[..., Any]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    st.cache_data / st.cache_resource plus call and miss counters (hits = calls - misses),
+    process-wide (metrics) and per script run (run log).
+    functools.wraps keeps Streamlit's cache key on the original function (module,
+    qualname and source), so entries are the same as with the bare decorator.
+    """
+
+    def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+        name = fn.__name__.lstrip("_")
+
+        @functools.wraps(fn)
+        def body(*args: Any, **kwargs: Any) -> Any:
+            CACHE_MISSES.inc(fn=name)
+            runlog.cache_call(name, miss=True)
+            return fn(*args, **kwargs)
+
+        cached = cache(show_spinner=False)(body)
+
+        @functools.wraps(fn)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            CACHE_CALLS.inc(fn=name)
+            runlog.cache_call(name)
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear  # type: ignore[attr-defined]
+        return call
+
+    return deco
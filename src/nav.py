@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, StopException, get_script_run_ctx
+
+from src import metrics, perf, runlog, slowruns
+from src.warm import startup_report, warm_for
+
+
+logger = logging.getLogger(__name__)
+
+
+class Route(NamedTuple):
+    script: str
+    title: str
+    icon: str
+    url_path: str  # "" → app root
+
+
+# Order = sidebar order. url_path keeps the URLs of the old pages/ auto-discovery
+# (./About_Me, ./Projects, ...) so existing links and bookmarks still resolve.
+# Scripts live in app_pages/, not pages/: with a pages/ folder next to the entry
+# point Streamlit still auto-discovers it and serves /Contact etc. directly,
+# bypassing this router.
+ROUTES: Dict[str, Route] = {
+    "home": Route("app_pages/Home.py", "Command Center", "🛰️", ""),
+    "about": Route("app_pages/1_About_Me.py", "About Me", "🛰️", "About_Me"),
+    "projects": Route("app_pages/2_Projects.py", "Projects", "🧪", "Projects"),
+    "contact": Route("app_pages/3_Contact.py", "Contact", "🛰️", "Contact"),
+    "lab": Route("app_pages/Lab.py", "Lab", "🧪", "Lab"),
+}
+
+TIMINGS_KEY = "nav_timings"
+LAST_ROUTE_KEY = "nav_last_route"
+GO_KEY = "nav_go"  # ?go= of the redirect hop, logged with the run it lands on
+TIMINGS_KEEP = 50
+
+
+def page_url(route: str, **params: str) -> str:
+    """Relative deep link to a route, e.g. page_url("lab", project="x") → "./Lab?project=x"."""
+    url = "./" + ROUTES[route].url_path
+    params = {k: v for k, v in params.items() if v not in (None, "")}
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def _pages() -> Dict[str, st.Page]:
+    return {
+        name: st.Page(r.script, title=r.title, icon=r.icon, url_path=r.url_path or None, default=not r.url_path)
+        for name, r in ROUTES.items()
+    }
+
+
+def _legacy_go(pages: Dict[str, st.Page]) -> None:
+    """
+    Old ?go=<route> links (hero menu, bookmarks): jump straight to the target page,
+    keeping every other query param (e.g. ?go=lab&project=x → /Lab?project=x).
+    Only this router script reruns; no page body executes twice. The hop itself
+    writes no run log line: ?go= is handed to the target run and logged there.
+    """
+    go = st.query_params.get("go")
+    if go in pages:
+        st.session_state[GO_KEY] = go
+        rest = {k: st.query_params.get_all(k) for k in st.query_params if k != "go"}
+        st.switch_page(pages[go], query_params=rest)
+
+
+def _timings() -> deque:
+    timings = st.session_state.get(TIMINGS_KEY)
+    if timings is None:
+        timings = st.session_state[TIMINGS_KEY] = deque(maxlen=TIMINGS_KEEP)
+    return timings
+
+
+def _record(timings: deque, route: Optional[str], resolve_ms: float, page_ms: float) -> None:
+    # no st.* call: runs after the page, which may have called st.stop()
+    timings.append({"route": route, "resolve_ms": resolve_ms, "page_ms": page_ms, "at": time.time()})
+    logger.debug("nav route=%s resolve_ms=%.2f page_ms=%.2f", route, resolve_ms, page_ms)
+
+
+def nav_timings() -> List[dict]:
+    """Per-navigation timings of this session: resolve_ms (router → first page byte), page_ms (page body)."""
+    return list(st.session_state.get(TIMINGS_KEY, ()))
+
+
+def run() -> None:
+    """
+    Entry point of the app: resolves the route before any page body runs, then runs
+    exactly one page script.
+    """
+    t0 = time.perf_counter()
+    pages = _pages()
+    _legacy_go(pages)
+
+    page = st.navigation(list(pages.values()), position="sidebar")
+    route = next((name for name, p in pages.items() if p.url_path == page.url_path), None)
+    go = st.session_state.pop(GO_KEY, None)
+
+    # background: fill the caches the likely next pages read (first call: everything)
+    warm_for(route)
+
+    # ?debug=perf → per-section timings of this run + per-page aggregates
+    # ?debug=metrics → Prometheus text of the process registry (also dumped to .cache/metrics.prom)
+    #                  and the startup warm-up report of this process
+    debug = st.query_params.get("debug", "")
+    metrics.start_dumper()
+    perf.start_memtrace()  # PORTFOLIO_TRACEMALLOC set → peak / held memory per timed section
+    page_name = route or "unknown"
+    metrics.SCRIPT_RUNS.inc(page=page_name)
+    if st.session_state.get(LAST_ROUTE_KEY) != route:
+        st.session_state[LAST_ROUTE_KEY] = route
+        metrics.PAGE_VIEWS.inc(page=page_name)
+
+    # read before the page runs: once it calls st.stop(), further st.* calls raise StopException
+    params = st.query_params.to_dict()
+    timings = _timings()
+    if go:
+        params["go"] = go
+    ctx = get_script_run_ctx(suppress_warning=True)
+    runlog.begin(ctx.session_id if ctx else None)  # one JSON line per run (.cache/runs.jsonl)
+    status, error = "ok", None
+
+    t1 = time.perf_counter()
+    perf.begin_run(page_name)
+    sampler = slowruns.start()  # PORTFOLIO_PROFILE_MS set → keep stacks of slow runs
+    try:
+        page.run()
+    except StopException:
+        status = "stopped"
+        raise
+    except RerunException:
+        status = "rerun"
+        raise
+    except Exception as e:
+        status, error = "error", f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        page_ms = (time.perf_counter() - t1) * 1000.0
+        slowruns.finish(sampler, page_name, params, page_ms)
+        run = perf.end_run(page_ms)
+        metrics.PAGE_SECONDS.observe(page_ms / 1000.0, page=page_name)
+        _record(timings, route, (t1 - t0) * 1000.0, page_ms)
+        runlog.end(page_name, params, page_ms, (t1 - t0) * 1000.0, status, error, run)
+        if debug == "perf":
+            perf.render_overlay(page_name, run, nav_timings())
+        elif debug == "metrics":
+            st.code(metrics.render(), language=None)
+            report = startup_report()  # this process' startup warm-up (steps still running: null)
+            if report is not None:
+                st.code(json.dumps(report, indent=2), language="json")
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import functools
+import html
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# =========================
+# Collection (per thread / per script run)
+# =========================
+# Each script run happens on its own thread: the router opens a run with
+# begin_run(page), timers append (name, ms, depth) to that thread's list and
+# end_run() folds them into the per-page aggregates. Timers outside a run
+# (warm-up thread, CLI) are aggregated under BACKGROUND.
+BACKGROUND = "background"
+KEEP = 200  # samples kept per (page, section) for percentiles
+
+_local = threading.local()
+_lock = threading.Lock()
+_samples: Dict[str, Dict[str, Deque[float]]] = {}
+_counts: Dict[str, Dict[str, int]] = {}
+
+Mem = Tuple[Optional[int], int]  # (high-water rise above the start or None, traced bytes delta at the end)
+Sample = Tuple[str, float, int, Optional[Mem]]  # (name, ms, depth, mem or None)
+
+
+def _add(page: str, name: str, ms: float) -> None:
+    with _lock:
+        _samples.setdefault(page, {}).setdefault(name, deque(maxlen=KEEP)).append(ms)
+        counts = _counts.setdefault(page, {})
+        counts[name] = counts.get(name, 0) + 1
+
+
+# =========================
+# Memory per section (opt-in: PORTFOLIO_TRACEMALLOC=1)
+# =========================
+# tracemalloc slows every allocation down, so it only runs when asked for. Its
+# counters are process-wide and are never reset here (reset_peak() would clobber
+# the peak of sections running concurrently on other threads). A section records
+# deltas of get_traced_memory() over its lifetime, so both values include whatever
+# other threads (concurrent sessions, the warm-up) allocated or freed meanwhile:
+#   - peak: how far the process-wide high-water mark rose above the section's start,
+#     known only when the section (or something concurrent) set a new high. When
+#     the high-water didn't move (e.g. the warm-up's training set it earlier), the
+#     section's own peak is unknown: None, and not observed in the histogram. The
+#     process traced-peak gauge is the sizing signal then.
+#   - held: traced bytes at the end minus at the start (can be negative).
+# Reliable per-section numbers need a single active session; with several they
+# are process-level indications, not attributions.
+MEMTRACE_ENV = "PORTFOLIO_TRACEMALLOC"
+
+
+def start_memtrace() -> bool:
+    """Starts tracemalloc once per process if PORTFOLIO_TRACEMALLOC is set; True if tracing."""
+    if os.environ.get(MEMTRACE_ENV, "") not in ("", "0") and not tracemalloc.is_tracing():
+        from src import metrics
+
+        tracemalloc.start()
+        metrics.gauge(
+            "portfolio_traced_peak_bytes",
+            "Process-wide high-water mark of traced Python allocations (PORTFOLIO_TRACEMALLOC).",
+            lambda: {metrics.labels(): tracemalloc.get_traced_memory()[1]} if tracemalloc.is_tracing() else {},
+        )
+    return tracemalloc.is_tracing()
+
+
+def _mem_enter() -> Tuple[int, int]:
+    return tracemalloc.get_traced_memory()  # (current, process high-water)
+
+
+def _mem_exit(name: str, start: Tuple[int, int]) -> Mem:
+    current, peak = tracemalloc.get_traced_memory()
+    start_current, start_peak = start
+    mem = (peak - start_current if peak > start_peak else None, current - start_current)
+    from src.metrics import STAGE_PEAK_BYTES, STAGE_RETAINED_BYTES
+
+    if mem[0] is not None:
+        STAGE_PEAK_BYTES.observe(mem[0], section=name)
+    STAGE_RETAINED_BYTES.observe(max(mem[1], 0), section=name)
+    return mem
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Times the block under `name` (nesting is kept for the overlay); memory too when tracing."""
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    mem_start = _mem_enter() if tracemalloc.is_tracing() else None
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000.0
+        mem = _mem_exit(name, mem_start) if mem_start is not None and tracemalloc.is_tracing() else None
+        _local.depth = depth
+        run: Optional[List[Sample]] = getattr(_local, "run", None)
+        if run is not None:
+            run.append((name, ms, depth, mem))
+        else:
+            _add(BACKGROUND, name, ms)
+
+
+def timed(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator form of timer(); defaults to the function name."""
+
+    def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with timer(label):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return deco
+
+
+def begin_run(page: str) -> None:
+    _local.page = page
+    _local.run = []
+    _local.depth = 0
+
+
+def end_run(total_ms: float) -> List[Sample]:
+    """Closes the current run: records its sections + "page" total, returns the run's samples."""
+    page = getattr(_local, "page", None) or BACKGROUND
+    run: List[Sample] = getattr(_local, "run", None) or []
+    _local.run = None
+    for name, ms, _, _ in run:
+        _add(page, name, ms)
+    _add(page, "page", total_ms)
+    return run + [("page", total_ms, 0, None)]
+
+
+def _percentile(ranked: List[float], q: float) -> float:
+    """q-th percentile of sorted values, linear interpolation (numpy.percentile's default)."""
+    pos = (len(ranked) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(ranked) - 1)
+    return ranked[lo] + (ranked[hi] - ranked[lo]) * (pos - lo)
+
+
+def page_stats(page: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    page -> section -> {n, last_ms, p50_ms, p95_ms, max_ms} (percentiles over the
+    last KEEP samples; n counts every sample since process start).
+    """
+    with _lock:
+        snap = {
+            p: {name: (list(s), _counts[p][name]) for name, s in sections.items()}
+            for p, sections in _samples.items()
+            if page is None or p == page
+        }
+    out: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for p, sections in snap.items():
+        out[p] = {}
+        for name, (a, n) in sections.items():
+            ranked = sorted(a)
+            out[p][name] = {
+                "n": n,
+                "last_ms": a[-1],
+                "p50_ms": _percentile(ranked, 50),
+                "p95_ms": _percentile(ranked, 95),
+                "max_ms": ranked[-1],
+            }
+    return out
+
+
+# =========================
+# ?debug=perf overlay
+# =========================
+OVERLAY_CSS = """
+<style>
+.perfbox{
+  position: fixed; right: 14px; bottom: 14px; z-index: 10000;
+  max-width: 420px; max-height: 60vh; overflow: auto;
+  padding: 10px 12px;
+  border-radius: 12px;
+  border: 1px solid rgba(255,255,255,.14);
+  background: rgba(0,0,0,.82);
+  backdrop-filter: blur(8px);
+  font: 11px/1.45 ui-monospace, SFMono-Regular, Menlo, Consolas, monospace;
+  color: rgba(255,255,255,.86);
+}
+.perfbox b{ color: rgba(255,255,255,.95); }
+.perfbox table{ border-collapse: collapse; width: 100%; margin-top: 4px; }
+.perfbox td{ padding: 1px 6px 1px 0; white-space: nowrap; border: 0; }
+.perfbox td.n{ text-align: right; color: rgba(255,255,255,.66); }
+</style>
+"""
+
+
+NAV_ROWS = 8  # navigations of the session listed in the overlay
+
+
+def _mb(n: float) -> str:
+    return f"{n / 2**20:.1f}"
+
+
+def overlay_html(page: str, run: List[Sample], nav: Sequence[Dict[str, Any]] = ()) -> str:
+    # repeated sections (e.g. one cover per card) collapse into one row: total ms ×count
+    # (with tracemalloc on: highest peak MB / total retained MB of those calls;
+    #  "–": no call raised the process high-water, so no peak is known)
+    merged: Dict[Tuple[str, int], List[Tuple[float, Optional[Mem]]]] = {}
+    for name, ms, depth, mem in run:
+        merged.setdefault((name, depth), []).append((ms, mem))
+    traced = any(mem for _, _, _, mem in run)
+
+    def mem_cells(v: List[Tuple[float, Optional[Mem]]]) -> str:
+        mems = [m for _, m in v if m]
+        if not traced:
+            return ""
+        if not mems:
+            return "<td></td><td></td>"
+        peaks = [m[0] for m in mems if m[0] is not None]
+        return (
+            f"<td class='n'>{_mb(max(peaks)) if peaks else '–'}</td>"
+            f"<td class='n'>{'+' if sum(m[1] for m in mems) >= 0 else ''}{_mb(sum(m[1] for m in mems))}</td>"
+        )
+
+    rows = "".join(
+        f"<tr><td>{'&nbsp;' * 2 * depth}{html.escape(name)}</td><td class='n'>{sum(ms for ms, _ in v):.1f} ms</td>"
+        f"<td class='n'>{'×' + str(len(v)) if len(v) > 1 else ''}</td>{mem_cells(v)}</tr>"
+        for (name, depth), v in merged.items()
+    )
+    head = "<tr><td></td><td></td><td></td><td class='n'>peak MB</td><td class='n'>held MB</td></tr>" if traced else ""
+    agg = page_stats(page).get(page, {})
+    agg_rows = "".join(
+        f"<tr><td>{html.escape(name)}</td><td class='n'>{s['n']}</td>"
+        f"<td class='n'>{s['p50_ms']:.1f}</td><td class='n'>{s['p95_ms']:.1f}</td><td class='n'>{s['max_ms']:.1f}</td></tr>"
+        for name, s in sorted(agg.items(), key=lambda kv: -kv[1]["p95_ms"])
+    )
+    traced_max = f" • process traced peak {_mb(tracemalloc.get_traced_memory()[1])} MB" if traced else ""
+    # latest navigations first (router → page resolve, page body)
+    nav_rows = "".join(
+        f"<tr><td>{html.escape(str(t['route']))}</td><td class='n'>{t['resolve_ms']:.1f}</td>"
+        f"<td class='n'>{t['page_ms']:.1f}</td></tr>"
+        for t in list(nav)[::-1][:NAV_ROWS]
+    )
+    nav_box = (
+        f"<div style='margin-top:8px;'><b>this session</b> (resolve, page ms)</div><table>{nav_rows}</table>"
+        if nav_rows
+        else ""
+    )
+    return (
+        f"{OVERLAY_CSS}<div class='perfbox'><b>perf • {html.escape(page)}</b> (this run)"
+        f"<table>{head}{rows}</table>"
+        f"<div style='margin-top:8px;'><b>this process</b> (n, p50, p95, max ms){traced_max}</div>"
+        f"<table>{agg_rows}</table>{nav_box}</div>"
+    )
+
+
+def render_overlay(page: str, run: List[Sample], nav: Sequence[Dict[str, Any]] = ()) -> None:
+    import streamlit as st
+
+    st.markdown(overlay_html(page, run, nav), unsafe_allow_html=True)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import warnings
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+# Above this many rows, cardinality is the nunique() of a sample instead of the whole
+# column: a lower bound (possibly far below the true count), shown as "≥ n (sampled)".
+EXACT_CARDINALITY_ROWS = 200_000
+CARDINALITY_SAMPLE = 50_000
+
+
+def _human_bytes(n: float) -> str:
+    for unit in ("bytes", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.1f} {unit}" if unit != "bytes" else f"{int(n)} bytes"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def _index_line(idx: pd.Index) -> str:
+    if isinstance(idx, pd.RangeIndex):
+        if len(idx):
+            return f"RangeIndex: {len(idx)} entries, {idx[0]} to {idx[-1]}"
+        return "RangeIndex: 0 entries"
+    return f"{type(idx).__name__}: {len(idx)} entries"
+
+
+def _cardinality(df: pd.DataFrame) -> tuple[pd.Series, bool]:
+    if len(df) <= EXACT_CARDINALITY_ROWS:
+        return df.nunique(dropna=True), True
+    sample = df.sample(n=CARDINALITY_SAMPLE, random_state=0)
+    return sample.nunique(dropna=True), False
+
+
+def profile_frame(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Dataset profile used by the Lab KPI cards and the df.info() panel, computed once
+    per asset version (src.cached.profile_asset, keyed by file_fingerprint: size +
+    mtime, like every other cache of the app, not by a content hash). Not a single
+    pass over the data: each statistic is one vectorized call over all columns
+    (no per-column Python loop):
+      - nulls / memory: one isna() and one memory_usage() over the whole frame
+      - min / max / quantiles: the numeric columns are copied once into a NumPy
+        block, then nanmin, nanmax and nanquantile each reduce it column-wise
+      - cardinality: exact nunique() up to EXACT_CARDINALITY_ROWS, above that the
+        nunique() of a sample (a lower bound, not an estimate of the true count)
+    Returns a plain dict (cheap to cache and pickle).
+    """
+    n_rows, n_cols = df.shape
+    dtypes = list(df.dtypes)
+
+    # positional (not by label): column names may repeat in uploaded files
+    nulls = df.isna().sum().to_numpy()
+    memory = df.memory_usage(index=False, deep=True).to_numpy()
+    index_memory = int(df.index.memory_usage(deep=True))
+
+    # bool columns count as numeric (as before) but get no min / max / quantiles
+    num_pos = [i for i, dt in enumerate(dtypes) if pd.api.types.is_numeric_dtype(dt)]
+    stat_pos = [i for i in num_pos if not pd.api.types.is_bool_dtype(dtypes[i])]
+    stats: Dict[int, Dict[str, float]] = {}
+    if stat_pos and n_rows:
+        block = df.iloc[:, stat_pos].to_numpy(dtype=float, na_value=np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+            mins = np.nanmin(block, axis=0)
+            maxs = np.nanmax(block, axis=0)
+            qs = np.nanquantile(block, QUANTILES, axis=0)
+        for j, i in enumerate(stat_pos):
+            stats[i] = {
+                "min": float(mins[j]),
+                "max": float(maxs[j]),
+                **{f"q{int(q * 100)}": float(qs[k, j]) for k, q in enumerate(QUANTILES)},
+            }
+
+    cardinality, exact = _cardinality(df)
+    cardinality = cardinality.to_numpy()
+
+    columns: List[Dict[str, Any]] = []
+    for i, c in enumerate(df.columns):
+        columns.append(
+            {
+                "name": str(c),
+                "dtype": str(dtypes[i]),
+                "non_null": int(n_rows - nulls[i]),
+                "nulls": int(nulls[i]),
+                "memory_bytes": int(memory[i]),
+                "cardinality": int(cardinality[i]),
+                **stats.get(i, {}),
+            }
+        )
+
+    dtype_counts = df.dtypes.astype(str).value_counts().sort_index()
+
+    return {
+        "rows": int(n_rows),
+        "cols": int(n_cols),
+        "n_numeric": len(num_pos),
+        "n_missing": int(nulls.sum()),
+        "memory_bytes": int(memory.sum()) + index_memory,
+        "cardinality_exact": exact,
+        "index": _index_line(df.index),
+        "dtypes": {k: int(v) for k, v in dtype_counts.items()},
+        "columns": columns,
+    }
+
+
+def profile_info_text(profile: Dict[str, Any]) -> str:
+    """
+    df.info()-style text rendered from a profile (no extra pass over the data).
+    Adds null and unique counts next to the usual columns; sampled unique counts
+    are lower bounds and print as "≥ n".
+    """
+    cols = profile.get("columns", [])
+    name_w = max([len("Column")] + [len(c["name"]) for c in cols])
+    exact = profile.get("cardinality_exact", True)
+    uniq = "Unique" if exact else "Unique (sampled)"
+    uniq_w = max(8, len(uniq))
+
+    lines = [
+        "<class 'pandas.core.frame.DataFrame'>",
+        profile.get("index", ""),
+        f"Data columns (total {profile.get('cols', 0)} columns):",
+        f" #   {'Column':<{name_w}}  Non-Null Count  {'Nulls':>6}  {uniq:>{uniq_w}}  Dtype",
+        f"---  {'-' * 6:<{name_w}}  --------------  {'-----':>6}  {'-' * len(uniq):>{uniq_w}}  -----",
+    ]
+    for i, c in enumerate(cols):
+        lines.append(
+            f" {i:<3} {c['name']:<{name_w}}  {str(c['non_null']) + ' non-null':<14}  "
+            f"{c['nulls']:>6}  {('' if exact else '≥ ') + str(c['cardinality']):>{uniq_w}}  {c['dtype']}"
+        )
+    dtypes = ", ".join(f"{k}({v})" for k, v in profile.get("dtypes", {}).items())
+    lines.append(f"dtypes: {dtypes}")
+    lines.append(f"memory usage: {_human_bytes(profile.get('memory_bytes', 0))}")
+    if not exact:
+        lines.append(f"unique: distinct values in a {CARDINALITY_SAMPLE:,}-row sample (lower bounds)")
+    return "\n".join(lines)
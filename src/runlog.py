@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import traceback
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Structured run log: one JSON line per script run (page, selected query params,
+# duration, status / error, per-run cache calls + misses, stage timings), keyed by
+# the Streamlit session id so a visitor's runs can be followed. Warnings and errors
+# of the app's own loggers (src.*) go to the same file with the session id of the
+# run that emitted them.
+#
+# Hot path = QueueHandler.put of the unformatted record. Formatting, JSON and file
+# writes happen on the listener thread; writes are buffered and flushed when the
+# queue drains (batched under load, immediate when idle).
+#
+# PORTFOLIO_RUN_LOG: log file (default .cache/runs.jsonl), "0" disables it.
+
+ROOT = Path(__file__).resolve().parents[1]
+LOG_PATH = ROOT / ".cache" / "runs.jsonl"
+LOG_ENV = "PORTFOLIO_RUN_LOG"
+MAX_BYTES = 10 * 2**20  # then runs.jsonl → runs.jsonl.1 (one backup)
+LOGGED_PARAMS = ("project", "go", "debug")
+
+logger = logging.getLogger("portfolio.runs")
+logger.propagate = False
+
+_local = threading.local()
+
+
+# =========================
+# Per-run context (script thread)
+# =========================
+def begin(session: Optional[str]) -> str:
+    """Opens the run of the current thread; returns its run id."""
+    _start()
+    _local.session = session
+    _local.run_id = uuid.uuid4().hex[:12]
+    _local.cache = {}
+    return _local.run_id
+
+
+def cache_call(fn: str, miss: bool = False) -> None:
+    """Counts a shared-cache call (or miss) for the current run; no-op outside runs."""
+    cache = getattr(_local, "cache", None)
+    if cache is None:
+        return
+    entry = cache.setdefault(fn, [0, 0])
+    entry[1 if miss else 0] += 1
+
+
+def end(
+    page: str,
+    params: Dict[str, Iterable[str]],
+    page_ms: float,
+    resolve_ms: float,
+    status: str,
+    error: Optional[str] = None,
+    stages: Iterable[tuple] = (),
+) -> None:
+    """Closes the run and queues its record (stages: perf samples of the run)."""
+    cache = getattr(_local, "cache", None) or {}
+    _local.cache = None
+    if _disabled:
+        return
+    merged: Dict[str, float] = {}
+    for name, ms, *_ in stages:
+        if name != "page":
+            merged[name] = merged.get(name, 0.0) + ms
+    run = {
+        "event": "run",
+        "session": getattr(_local, "session", None),
+        "run": getattr(_local, "run_id", None),
+        "page": page,
+        "params": {k: params[k] for k in LOGGED_PARAMS if k in params},
+        "status": status,
+        "page_ms": round(page_ms, 2),
+        "resolve_ms": round(resolve_ms, 2),
+        "cache": {fn: {"calls": c, "misses": m} for fn, (c, m) in cache.items()},
+        "stages": {k: round(v, 2) for k, v in merged.items()},
+    }
+    if error:
+        run["error"] = error
+    logger.info("run", extra={"run": run})
+
+
+# =========================
+# Queue → JSON lines file
+# =========================
+class _Enqueue(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # in-process queue: hand over the record as is, format on the listener thread
+        return record
+
+
+class _Correlate(logging.Filter):
+    """Stamps records with the session / run of the thread that logs them."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session = getattr(_local, "session", None)
+        record.run_id = getattr(_local, "run_id", None)
+        return True
+
+
+class _JsonLines(logging.Handler):
+    def __init__(self, path: Path, q: "queue.SimpleQueue[logging.LogRecord]"):
+        super().__init__()
+        self.path, self.q = path, q
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.stream = path.open("a", encoding="utf-8", buffering=64 * 1024)
+
+    def line(self, record: logging.LogRecord) -> Dict[str, Any]:
+        base = {"ts": round(record.created, 3), "level": record.levelname}
+        run = getattr(record, "run", None)
+        if run is not None:
+            return {**base, **run}
+        out = {
+            **base,
+            "event": "log",
+            "logger": record.name,
+            "session": getattr(record, "session", None),
+            "run": getattr(record, "run_id", None),
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            out["exc"] = "".join(traceback.format_exception(*record.exc_info)).strip()
+        return out
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(json.dumps(self.line(record), default=str, ensure_ascii=False) + "\n")
+            if self.q.empty():
+                self.stream.flush()
+                if self.stream.tell() > MAX_BYTES:
+                    self.stream.close()
+                    self.path.replace(self.path.with_name(self.path.name + ".1"))
+                    self.stream = self.path.open("a", encoding="utf-8", buffering=64 * 1024)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            super().close()
+
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_disabled = False
+
+
+def _path() -> Optional[Path]:
+    value = os.environ.get(LOG_ENV, "")
+    if value == "0":
+        return None
+    return Path(value) if value else LOG_PATH
+
+
+def _start() -> bool:
+    """Starts the listener once per process; False if the run log is disabled."""
+    global _listener, _disabled
+    if _listener is not None or _disabled:
+        return not _disabled
+    with _lock:
+        if _listener is not None or _disabled:
+            return not _disabled
+        path = _path()
+        if path is None:
+            _disabled = True
+            return False
+        q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        try:
+            sink = _JsonLines(path, q)
+        except OSError:
+            logging.getLogger(__name__).exception("run log disabled: cannot open %s", path)
+            _disabled = True
+            return False
+
+        logger.addHandler(_Enqueue(q))
+        logger.setLevel(logging.INFO)
+        app = _Enqueue(q)
+        app.setLevel(logging.WARNING)
+        app.addFilter(_Correlate())
+        logging.getLogger("src").addHandler(app)
+
+        _listener = QueueListener(q, sink)
+        _listener.start()
+        atexit.register(stop)
+        return True
+
+
+def stop() -> None:
+    """Writes out every queued record and closes the file (at exit; tests)."""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import time
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, TextIO
+
+import numpy as np
+import pandas as pd
+
+from src.brand import STATIC_DIR, STATIC_URL
+from src.lab_pipeline import MAX_LAG, ROLL, feature_names, infer_datetime_col, infer_target_col, make_features
+
+
+CHUNK_ROWS = 50_000
+STEP = pd.Timedelta(hours=1)
+
+# Scored files are written to static/scored/ and downloaded through Streamlit's
+# static serving (streamed from disk, never through the session's media manager).
+# One file per session, named by a random per-session token; there is no
+# session-end hook, so files untouched for SCORED_TTL_S are swept on every write.
+SCORED_DIR = STATIC_DIR / "scored"
+SCORED_TTL_S = 2 * 3600
+
+
+def new_scored_token() -> str:
+    """Random per-session file token (the static URL is public: it must not be guessable)."""
+    return uuid.uuid4().hex
+
+
+def sweep_scored(scored_dir: Path = SCORED_DIR, ttl_s: float = SCORED_TTL_S) -> int:
+    """Removes scored files (and stray partial writes) older than ttl_s; returns how many."""
+    cutoff = time.time() - ttl_s
+    removed = 0
+    for path in scored_dir.glob("lab_scored_*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:  # swept by another session meanwhile
+            pass
+    return removed
+
+
+def scored_file(token: str, scored_dir: Path = SCORED_DIR) -> Path:
+    """Scored file of the session with this token (after sweeping expired ones)."""
+    scored_dir.mkdir(parents=True, exist_ok=True)
+    sweep_scored(scored_dir)
+    return scored_dir / f"lab_scored_{token}.csv"
+
+
+def scored_url(path: Path) -> str:
+    return f"{STATIC_URL}/{path.relative_to(STATIC_DIR).as_posix()}"
+
+
+def iter_table_chunks(file: BinaryIO, name: str, chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Streams a CSV or Parquet file in fixed-size chunks (never materializes the whole
+    parsed table; `file` itself may already be in memory, e.g. a Streamlit upload).
+    """
+    suffix = Path(name).suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(file, chunksize=chunk_rows)
+
+
+def _check_hourly(index: pd.DatetimeIndex, prev: Optional[pd.Timestamp], offset: int) -> None:
+    """Raises ValueError unless index (preceded by prev) steps by exactly one hour."""
+    stamps = index if prev is None else index.insert(0, prev)
+    if len(stamps) < 2:
+        return
+    steps = stamps[1:] - stamps[:-1]
+    bad = np.flatnonzero(steps != STEP)
+    if bad.size:
+        i = int(bad[0])
+        row = offset + i + (1 if prev is None else 0)
+        raise ValueError(
+            f"Rows must be hourly and in time order: row {row + 1:,} ({stamps[i + 1]}) "
+            f"follows {stamps[i]}. Sort the file and fill missing hours before scoring."
+        )
+
+
+def score_chunks(
+    chunks: Iterator[pd.DataFrame],
+    model: Any,
+    out: TextIO,
+    dt_col: Optional[str] = None,
+    y_col: Optional[str] = None,
+    max_lag: int = MAX_LAG,
+    roll: int = ROLL,
+    on_chunk: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    One-step-ahead scoring of an hourly series, chunk by chunk.
+
+    Rows must be in time order, exactly one hour apart, with the observed target;
+    anything else (unsorted, duplicated, sub-hourly or missing hours) raises
+    ValueError, since lags and rolling windows count rows, not hours. The check
+    spans chunk boundaries. The last max(lag, roll) rows of each chunk are carried
+    into the next one so lag/rolling features are continuous across chunks; only
+    that tail and the current chunk are held by the scoring step. Predictions are
+    appended to `out` as CSV (timestamp, actual, prediction). Rows without enough
+    history get an empty prediction; rows whose timestamp does not parse are
+    skipped and counted in stats["dropped"] (rows = dropped + written rows).
+    """
+    window = max(max_lag, roll)
+    cols = feature_names(max_lag, roll)
+    carry: Optional[pd.Series] = None
+
+    stats: Dict[str, Any] = {"rows": 0, "dropped": 0, "scored": 0, "chunks": 0, "seconds": 0.0, "rows_per_s": 0.0}
+    t0 = time.perf_counter()
+    header = True
+    written = 0
+
+    for chunk in chunks:
+        if dt_col is None or dt_col not in chunk.columns:
+            dt_col = infer_datetime_col(chunk)
+        if y_col is None or y_col not in chunk.columns:
+            y_col = infer_target_col(chunk)
+        if not dt_col or not y_col:
+            raise ValueError("Could not infer datetime column or target column.")
+
+        ts = pd.Series(
+            pd.to_numeric(chunk[y_col], errors="coerce").to_numpy(dtype=float),
+            index=pd.to_datetime(chunk[dt_col], errors="coerce"),
+            name=y_col,
+        )
+        n_read = len(ts)
+        ts = ts[ts.index.notna()]
+        _check_hourly(ts.index, None if carry is None else carry.index[-1], written)
+
+        context = ts if carry is None else pd.concat([carry, ts])
+        n_ctx = 0 if carry is None else len(carry)
+
+        pred = np.full(len(ts), np.nan)
+        feat = make_features(context, max_lag=max_lag, roll=roll)
+        if len(feat):
+            # positions (inside `context`) of the rows that have a full feature set
+            pos = context.index.get_indexer(feat.index)
+            keep = pos >= n_ctx
+            if keep.any():
+                X = feat[cols].to_numpy(dtype=float)[keep]
+                pred[pos[keep] - n_ctx] = model.predict(X)
+
+        pd.DataFrame(
+            {"timestamp": ts.index, "actual": ts.to_numpy(), "prediction": pred}
+        ).to_csv(out, index=False, header=header)
+        header = False
+
+        if len(context):
+            carry = context.iloc[-window:]
+        written += len(ts)
+        stats["rows"] += n_read
+        stats["dropped"] += n_read - len(ts)
+        stats["scored"] += int(np.isfinite(pred).sum())
+        stats["chunks"] += 1
+        stats["seconds"] = time.perf_counter() - t0
+        stats["rows_per_s"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+        if on_chunk is not None:
+            on_chunk(dict(stats))
+
+    stats["dt_col"], stats["y_col"] = dt_col, y_col
+    return stats
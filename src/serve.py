@@ -0,0 +1,49 @@
+"""
+Server entry point that warms the caches at start-up, before the first visitor:
+
+    python -m src.serve [streamlit run options]      e.g. --server.port 8501
+
+Same as `streamlit run Command_Center.py`, plus a thread that waits for the
+Streamlit runtime (the shared caches live in it) and then starts
+src.warm.warm_startup. .cache/warmup.json turns "ready": false at once and
+"ready": true when every step is warm, without waiting for a session. Under
+plain `streamlit run`, the first visitor starts the same warm-up.
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from src.warm import ROOT, warm_startup
+
+
+logger = logging.getLogger(__name__)
+
+ENTRY = ROOT / "Command_Center.py"
+RUNTIME_WAIT_S = 60.0
+
+
+def _warm_when_up() -> None:
+    from streamlit import runtime
+
+    deadline = time.monotonic() + RUNTIME_WAIT_S
+    while not runtime.exists():
+        if time.monotonic() > deadline:
+            logger.warning("streamlit runtime not up after %.0f s: warm-up left to the first visitor", RUNTIME_WAIT_S)
+            return
+        time.sleep(0.1)
+    warm_startup()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from streamlit.web import cli
+
+    threading.Thread(target=_warm_when_up, name="startup-warmer", daemon=True).start()
+    return cli.main(args=["run", str(ENTRY), *(sys.argv[1:] if argv is None else argv)], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
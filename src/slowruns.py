@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Opt-in stack sampler for slow script runs. With PORTFOLIO_PROFILE_MS set, every
+# page run is sampled from a side thread (sys._current_frames, no tracing hooks, so
+# the page itself runs at full speed); runs slower than the threshold are written
+# to .cache/profiles/ and only the PORTFOLIO_PROFILE_KEEP slowest files are kept.
+# Stacks are stored folded ("a;b;c count"), the input of flamegraph.pl, inferno
+# and speedscope:
+#
+#     python -m src.slowruns                  # list kept profiles, slowest first
+#     python -m src.slowruns <file> > x.folded
+
+ROOT = Path(__file__).resolve().parents[1]
+PROFILE_DIR = ROOT / ".cache" / "profiles"
+
+THRESHOLD_ENV = "PORTFOLIO_PROFILE_MS"
+KEEP_ENV = "PORTFOLIO_PROFILE_KEEP"
+INTERVAL_ENV = "PORTFOLIO_PROFILE_INTERVAL_MS"
+DEFAULT_KEEP = 20
+DEFAULT_INTERVAL_MS = 5.0
+
+
+def _env_float(name: str, default: Optional[float]) -> Optional[float]:
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def threshold_ms() -> Optional[float]:
+    """Slow-run threshold in ms; None = profiling off."""
+    return _env_float(THRESHOLD_ENV, None)
+
+
+# =========================
+# Sampler
+# =========================
+_labels: Dict[CodeType, str] = {}  # code object -> "name (path:" (resolved once, not per sample)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    prefix = _labels.get(code)
+    if prefix is None:
+        try:
+            path = Path(code.co_filename).resolve().relative_to(ROOT).as_posix()
+        except ValueError:
+            path = Path(code.co_filename).name
+        # ';' separates frames in the folded format (the count is split off at the last space)
+        prefix = _labels[code] = f"{code.co_name} ({path}:".replace(";", ",")
+    return f"{prefix}{frame.f_lineno})"
+
+
+def _in_repo(filename: str) -> bool:
+    return filename.startswith(str(ROOT) + os.sep) and "site-packages" not in filename
+
+
+def _stack(frame: Optional[FrameType]) -> str:
+    frames: List[FrameType] = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    # drop Streamlit's script runner above the app: start at the first repo frame
+    start = next((i for i, f in enumerate(frames) if _in_repo(f.f_code.co_filename)), 0)
+    return ";".join(_frame_label(f) for f in frames[start:])
+
+
+class Sampler:
+    """Samples the calling thread's stack every `interval_ms` until stop()."""
+
+    def __init__(self, interval_ms: float = DEFAULT_INTERVAL_MS):
+        self.interval = interval_ms / 1000.0
+        self.target = threading.get_ident()
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="slowruns-sampler", daemon=True)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            if frame is not None:
+                self.stacks[_stack(frame)] += 1
+
+    def start(self) -> "Sampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+def start() -> Optional[Sampler]:
+    """Starts sampling the current script run; None when profiling is off."""
+    if threshold_ms() is None:
+        return None
+    return Sampler(_env_float(INTERVAL_ENV, DEFAULT_INTERVAL_MS)).start()
+
+
+def finish(sampler: Optional[Sampler], page: str, query: Dict[str, Any], total_ms: float) -> Optional[Path]:
+    """Stops the sampler; keeps the profile if the run was slower than the threshold."""
+    if sampler is None:
+        return None
+    stacks = sampler.stop()
+    limit = threshold_ms()
+    if limit is None or total_ms < limit or not stacks:
+        return None
+    try:
+        return save(
+            {
+                "page": page,
+                "query": query,
+                "ms": round(total_ms, 2),
+                "at": time.time(),
+                "interval_ms": sampler.interval * 1000.0,
+                "samples": sum(stacks.values()),
+                "stacks": dict(stacks.most_common()),
+            }
+        )
+    except OSError:
+        logger.exception("could not write slow-run profile for %s", page)
+        return None
+
+
+# =========================
+# Storage (top-N slowest)
+# =========================
+_store_lock = threading.Lock()
+
+
+def _ms_of(path: Path) -> float:
+    # file names start with the run duration: 00012345ms_<page>_<stamp>.json
+    m = re.match(r"(\d+)ms_", path.name)
+    return float(m.group(1)) if m else 0.0
+
+
+def profiles(directory: Path = PROFILE_DIR) -> List[Path]:
+    """Kept profile files, slowest first."""
+    return sorted(directory.glob("*ms_*.json"), key=_ms_of, reverse=True)
+
+
+def save(profile: Dict[str, Any], directory: Path = PROFILE_DIR, keep: Optional[int] = None) -> Optional[Path]:
+    """Writes `profile` and prunes the directory to the `keep` slowest (None if it didn't make it)."""
+    keep = int(_env_float(KEEP_ENV, DEFAULT_KEEP)) if keep is None else keep
+    page = re.sub(r"[^\w-]", "_", profile["page"])
+    out = directory / f"{int(profile['ms']):08d}ms_{page}_{int(profile['at'] * 1000)}.json"
+    with _store_lock:
+        existing = profiles(directory)
+        if len(existing) >= keep and existing and _ms_of(existing[keep - 1]) >= profile["ms"]:
+            return None
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix(".tmp")
+        tmp.write_text(json.dumps(profile), encoding="utf-8")
+        tmp.replace(out)
+        for old in profiles(directory)[keep:]:
+            old.unlink(missing_ok=True)
+    logger.info("slow run page=%s ms=%.0f profile=%s", profile["page"], profile["ms"], out.name)
+    return out
+
+
+def folded(profile: Dict[str, Any]) -> str:
+    """Folded stacks ("frame;frame;frame count" per line) for flamegraph tools."""
+    return "".join(f"{stack} {n}\n" for stack, n in profile["stacks"].items())
+
+
+# =========================
+# CLI
+# =========================
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.slowruns",
+        description="List kept slow-run profiles, or print one as folded stacks (flamegraph.pl / speedscope).",
+    )
+    parser.add_argument("profile", nargs="?", type=Path, help="profile file to export (name or path)")
+    parser.add_argument("--dir", type=Path, default=PROFILE_DIR, help=f"profiles directory (default: {PROFILE_DIR.relative_to(ROOT)})")
+    args = parser.parse_args(argv)
+
+    if args.profile is None:
+        for path in profiles(args.dir):
+            p = json.loads(path.read_text(encoding="utf-8"))
+            query = "&".join(f"{k}={v}" for k, v in p["query"].items())
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(p["at"]))
+            print(f"{p['ms']:>9.0f} ms  {p['page']:<9} {when}  {p['samples']:>5} samples  {query:<30} {path.name}")
+        return 0
+
+    path = args.profile if args.profile.exists() else args.dir / args.profile
+    sys.stdout.write(folded(json.loads(path.read_text(encoding="utf-8"))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
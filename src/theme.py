@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+
+# =========================
+# Design system (shared by every page)
+# =========================
+BASE_CSS = """
+header[data-testid="stHeader"] {display:none;}
+footer {visibility:hidden;}
+
+:root{
+  --fg: rgba(255,255,255,.92);
+  --fg2: rgba(255,255,255,.72);
+  --line: rgba(255,255,255,.10);
+  --card: rgba(255,255,255,.04);
+  --shadow: rgba(0,0,0,.35);
+  --accent: rgba(255, 80, 90, .95);
+}
+
+html, body, [data-testid="stAppViewContainer"]{
+  background: radial-gradient(900px 520px at 50% 0%, rgba(255,255,255,.05), rgba(0,0,0,.98)) !important;
+  color: var(--fg) !important;
+}
+
+h1,h2,h3{ letter-spacing: -0.03em; }
+p, li, small { color: var(--fg2); }
+a { text-decoration: none !important; }
+
+.hr{ height:1px; background: var(--line); margin: 16px 0 22px 0; }
+.small{ color: rgba(255,255,255,.72); }
+
+.topbar{
+  display:flex; align-items:flex-start; justify-content:space-between;
+  gap: 12px;
+}
+.navbtns{ display:flex; gap:10px; flex-wrap:wrap; justify-content:flex-end; }
+.navbtns a{
+  display:inline-block;
+  padding: 9px 12px;
+  border-radius: 999px;
+  border: 1px solid var(--line);
+  background: rgba(255,255,255,.04);
+  color: rgba(255,255,255,.88) !important;
+  font-size: 13px;
+}
+.navbtns a:hover{ background: rgba(255,255,255,.07); }
+
+.card{
+  border: 1px solid var(--line);
+  background: linear-gradient(180deg, var(--card), rgba(0,0,0,.18));
+  border-radius: 18px;
+  padding: 16px 16px;
+}
+
+.pills{ display:flex; gap:8px; flex-wrap:wrap; margin-top: 10px; }
+.pill{
+  padding: 6px 9px;
+  border-radius: 999px;
+  border: 1px solid var(--line);
+  background: rgba(0,0,0,.18);
+  color: rgba(255,255,255,.78);
+  font-size: 12px;
+}
+
+.tagwrap{ display:flex; gap:10px; flex-wrap:wrap; }
+.tag{
+  padding: 7px 10px;
+  border-radius: 12px;
+  border: 1px solid var(--line);
+  background: rgba(0,0,0,.18);
+  color: rgba(255,255,255,.78);
+  font-size: 12px;
+}
+
+.links a{
+  display:inline-block;
+  padding: 8px 12px;
+  border-radius: 999px;
+  border: 1px solid var(--line);
+  background: rgba(255,255,255,.04);
+  color: rgba(255,255,255,.88) !important;
+  margin-right: 8px;
+  margin-top: 10px;
+  font-size: 13px;
+}
+.links a:hover{ background: rgba(255,255,255,.07); }
+"""
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return css.strip()
+
+
+@lru_cache(maxsize=32)
+def stylesheet(page_css: str = "", base: bool = True) -> str:
+    """
+    Minified <style> tag: design-system base + page-specific rules (page rules win).
+    Built once per process for each distinct page_css; the version attribute
+    changes whenever the CSS does.
+    """
+    css = minify_css((BASE_CSS if base else "") + "\n" + page_css)
+    version = hashlib.blake2b(css.encode("utf-8"), digest_size=4).hexdigest()
+    return f'<style data-theme="{version}">{css}</style>'
+
+
+def inject_theme(page_css: str = "", base: bool = True) -> None:
+    st.markdown(stylesheet(page_css, base), unsafe_allow_html=True)
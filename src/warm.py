@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.loaders import file_fingerprint
+
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / "data" / "projects.yaml"
+STATUS_PATH = ROOT / ".cache" / "warmup.json"
+# identifies this server process in the status file (pids get reused across restarts)
+PROCESS_ID = uuid.uuid4().hex[:12]
+
+
+# Warm-up training runs beside live sessions: leave the other cores to them
+WARM_N_JOBS = 1
+
+
+# =========================
+# Warm-up steps (each fills the shared caches of src/cached.py)
+# =========================
+# src.cached (pandas, scikit-learn, scipy) is imported inside the steps: they run
+# on the warm-up thread, so the router that imports this module stays light.
+def warm_catalog(root: Path = ROOT) -> int:
+    """projects.yaml → cleaned (Projects) and raw (Lab) catalogs."""
+    from src.cached import catalog, catalog_raw
+
+    data = root / "data" / "projects.yaml"
+    catalog(data)
+    return len(catalog_raw(data))
+
+
+def warm_search(root: Path = ROOT) -> int:
+    """Projects search haystacks + filter facets."""
+    from src.cached import search_index
+
+    return len(search_index(root / "data" / "projects.yaml")["haystack"])
+
+
+def warm_covers(root: Path = ROOT) -> int:
+    """Every local project cover → its web-sized copy in static/covers/."""
+    from src.assets import cover_img_tag
+    from src.cached import catalog
+
+    return sum(1 for p in catalog(root / "data" / "projects.yaml") if cover_img_tag(p.get("cover", ""), root))
+
+
+def demo_assets(root: Path = ROOT) -> List[Path]:
+    """Distinct, existing lab.demo_asset files of the catalog."""
+    from src.cached import catalog_raw
+
+    seen: Dict[Path, None] = {}
+    for p in catalog_raw(root / "data" / "projects.yaml"):
+        asset = ((p or {}).get("lab") or {}).get("demo_asset", "")
+        path = root / asset if asset else None
+        if path is not None and path.is_file():
+            seen.setdefault(path, None)
+    return list(seen)
+
+
+def warm_lab(root: Path = ROOT) -> int:
+    """Each Lab demo asset → CSV, profile, trained models (single core) and forecaster."""
+    from src.cached import forecaster, load_csv, profile_asset, train_lab
+
+    assets = demo_assets(root)
+    for path in assets:
+        fp = file_fingerprint(path)
+        load_csv(str(path), fp)
+        profile_asset(str(path), fp)
+        train_lab(str(path), fp, _n_jobs=WARM_N_JOBS)
+        forecaster(str(path), fp)
+    return len(assets)
+
+
+def warm_brand(root: Path = ROOT) -> int:
+    """Optimized logo variant (static/brand/) used by every page."""
+    from src.brand import logo_file
+
+    return int(logo_file() is not None)
+
+
+STEPS: Dict[str, Callable[[Path], int]] = {
+    "brand": warm_brand,
+    "catalog": warm_catalog,
+    "search": warm_search,
+    "covers": warm_covers,
+    "lab": warm_lab,
+}
+
+# What a route needs warm, and where visitors usually go next from it
+ROUTE_STEPS: Dict[str, Tuple[str, ...]] = {
+    "projects": ("catalog", "search", "covers"),
+    "lab": ("catalog", "lab"),
+}
+NEXT_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "home": ("projects", "lab"),
+    "about": ("projects",),
+    "projects": ("lab",),
+    "contact": ("projects",),
+    "lab": ("projects",),
+}
+
+
+# =========================
+# Timed runs + readiness status
+# =========================
+def run_step(name: str, root: Path = ROOT) -> Dict[str, Any]:
+    """Runs one step; never raises (a warm-up miss only means a cold first visit)."""
+    t0 = time.perf_counter()
+    try:
+        items, error = STEPS[name](root), None
+    except Exception as e:
+        items, error = 0, f"{type(e).__name__}: {e}"
+        logger.exception("warm step %s failed", name)
+    out = {"ok": error is None, "ms": round((time.perf_counter() - t0) * 1000.0, 2), "items": items}
+    if error:
+        out["error"] = error
+    logger.debug("warm step=%s %s", name, out)
+    return out
+
+
+def write_status(report: Dict[str, Any], path: Path = STATUS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def warm_all(root: Path = ROOT, steps: Optional[Iterable[str]] = None, status: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Runs every step (or `steps`) in order, synchronously, and returns the report:
+    {ready, pid, process, started_at, total_ms, catalog, steps: {name: {ok, ms, items[, error]}}}.
+    The report is also written to `status`, if given. It only describes the caches
+    of this process: a server's readiness is written by warm_startup.
+    """
+    names = [n for n in (steps or STEPS) if n in STEPS]
+    report: Dict[str, Any] = {
+        "ready": False,
+        "pid": os.getpid(),
+        "process": PROCESS_ID,
+        "started_at": time.time(),
+        "catalog": file_fingerprint(root / "data" / "projects.yaml"),
+        "steps": {},
+    }
+    t0 = time.perf_counter()
+    for name in names:
+        report["steps"][name] = run_step(name, root)
+    report["total_ms"] = round((time.perf_counter() - t0) * 1000.0, 2)
+    report["ready"] = all(r["ok"] for r in report["steps"].values())
+    if status is not None:
+        write_status(report, status)
+    return report
+
+
+# =========================
+# Background service
+# =========================
+# A failing step is retried after RETRY_MIN_S, doubling per failure up to
+# RETRY_MAX_S, instead of on every navigation.
+RETRY_MIN_S = 30.0
+RETRY_MAX_S = 900.0
+
+_lock = threading.Lock()
+_done: Dict[str, str] = {}  # step -> version it was warmed for (_version)
+_failed: Dict[str, Tuple[int, float]] = {}  # step -> (consecutive failures, monotonic time of next retry)
+_pending: List[str] = []
+_worker: Optional[threading.Thread] = None
+_startup: Optional[Dict[str, Any]] = None  # report of the first (all-steps) run in this process
+
+
+def _version(step: str, root: Path) -> str:
+    """What a step's cache entries are keyed on: the catalog version, plus each demo asset's for "lab"."""
+    fp = file_fingerprint(root / "data" / "projects.yaml")
+    if step == "lab":
+        fp += "|" + "|".join(file_fingerprint(path) for path in demo_assets(root))
+    return fp
+
+
+def _drain(root: Path) -> None:
+    global _worker
+    while True:
+        with _lock:
+            if not _pending:
+                _worker = None
+                break
+            step = _pending.pop(0)
+        version = _version(step, root)  # before the run: an edit during it warms again next time
+        result = run_step(step, root)
+        with _lock:
+            if result["ok"]:
+                _done[step] = version
+                _failed.pop(step, None)
+            else:
+                failures = _failed.get(step, (0, 0.0))[0] + 1
+                _failed[step] = (failures, time.monotonic() + min(RETRY_MIN_S * 2 ** (failures - 1), RETRY_MAX_S))
+            if _startup is not None and step in _startup["steps"] and _startup["steps"][step] is None:
+                _startup["steps"][step] = result
+    if _startup is not None and "total_ms" not in _startup:
+        _startup["total_ms"] = round((time.time() - _startup["started_at"]) * 1000.0, 2)
+        _startup["ready"] = all(r and r["ok"] for r in _startup["steps"].values())
+        write_status(_startup)
+
+
+def warm_async(steps: Iterable[str], root: Path = ROOT) -> Optional[threading.Thread]:
+    """
+    Queues steps that are not warm yet for the current catalog (and, for "lab",
+    demo asset) versions and not waiting out a failure backoff, and runs them in
+    one daemon thread (at most one per process). Returns the thread, if any. The thread has no script run context:
+    it outlives the session that queued it, and the cache functions don't need one.
+    """
+    global _worker
+    steps = list(steps)
+    # only steps warmed before need a version check (demo_assets reads the cached catalog)
+    versions = {step: _version(step, root) for step in steps if step in STEPS and step in _done}
+    now = time.monotonic()
+    with _lock:
+        for step in steps:
+            backoff = step in _failed and _failed[step][1] > now
+            stale = step not in _done or _done[step] != versions.get(step)
+            if step in STEPS and stale and step not in _pending and not backoff:
+                _pending.append(step)
+        if not _pending or _worker is not None:
+            return _worker
+        _worker = threading.Thread(target=_drain, args=(root,), name="cache-warmer", daemon=True)
+        _worker.start()
+        return _worker
+
+
+def warm_startup() -> Optional[threading.Thread]:
+    """
+    Server start: the first call in a process writes a "ready": false status for
+    this process, warms every step and rewrites the status when done; later calls
+    do nothing. Run by src.serve as soon as the runtime exists, otherwise by the
+    first warm_for (i.e. the first visitor).
+    """
+    global _startup
+    with _lock:
+        if _startup is not None:
+            return None
+        _startup = {
+            "ready": False,
+            "pid": os.getpid(),
+            "process": PROCESS_ID,
+            "started_at": time.time(),
+            "catalog": file_fingerprint(DATA),
+            "steps": {name: None for name in STEPS},
+        }
+        status = json.loads(json.dumps(_startup))
+    # not ready yet: replaces a previous process' (possibly ready) status right away
+    try:
+        write_status(status)
+    except OSError:
+        logger.exception("could not write warm-up status %s", STATUS_PATH)
+    return warm_async(STEPS)
+
+
+def warm_for(route: Optional[str]) -> Optional[threading.Thread]:
+    """
+    Navigation hint: warms what the current route's likely next pages need
+    (after the start-up warm-up, if no one has run it yet).
+    """
+    if _startup is None:
+        return warm_startup()
+    steps: List[str] = []
+    for nxt in NEXT_ROUTES.get(route or "", ()):
+        steps.extend(ROUTE_STEPS.get(nxt, ()))
+    return warm_async(steps)
+
+
+def startup_report() -> Optional[Dict[str, Any]]:
+    """Startup warm-up report of this process (steps still running are None)."""
+    with _lock:
+        return None if _startup is None else json.loads(json.dumps(_startup))
+
+
+# =========================
+# CLI
+# =========================
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.warm",
+        description=(
+            "Run every warm-up step in this process and report per-step timings (exit 1 if a step fails). "
+            "To warm a server at start-up, run it with `python -m src.serve`."
+        ),
+    )
+    parser.add_argument("--steps", nargs="+", choices=list(STEPS), help="subset of steps (default: all)")
+    # Not the server's status file by default: the caches filled here die with this
+    # process, so a "ready" written by it would not describe any server.
+    parser.add_argument("--status", type=Path, default=None, help="also write the report to this file (default: none)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = warm_all(ROOT, args.steps, args.status)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, r in report["steps"].items():
+            state = "ok  " if r["ok"] else "FAIL"
+            print(f"{state} {name:<8} {r['ms']:>9.1f} ms  {r['items']:>4} items  {r.get('error', '')}")
+        print(f"{'ready' if report['ready'] else 'NOT READY'} in {report['total_ms']:.1f} ms")
+    return 0 if report["ready"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
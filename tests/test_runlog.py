@@ -0,0 +1,45 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from src import runlog
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def run_log(tmp_path, monkeypatch):
+    """Fresh run log listener writing to a temporary file; stopped (and flushed) by read()."""
+    path = tmp_path / "runs.jsonl"
+    monkeypatch.setenv(runlog.LOG_ENV, str(path))
+    monkeypatch.setattr(runlog, "_listener", None)
+    monkeypatch.setattr(runlog, "_disabled", False)
+    handlers = {name: list(logging.getLogger(name).handlers) for name in ("portfolio.runs", "src")}
+
+    def read():
+        runlog.stop()
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    yield read
+    runlog.stop()
+    for name, before in handlers.items():
+        logging.getLogger(name).handlers[:] = before
+
+
+def test_go_redirect_is_logged_with_the_target_run(run_log):
+    at = AppTest.from_file(str(ROOT / "Command_Center.py"), default_timeout=60)
+    at.query_params["go"] = "lab"
+    at.query_params["project"] = "x"
+    at.run()
+    assert not at.exception
+
+    runs = [line for line in run_log() if line["event"] == "run"]
+    assert len(runs) == 1  # the ?go= hop itself writes no line
+    (run,) = runs
+    assert run["page"] == "lab"
+    assert run["params"] == {"project": "x", "go": "lab"}
+    assert run["status"] == "stopped"  # unknown project: the Lab stops after its intro card
+    assert run["session"] and run["run"]
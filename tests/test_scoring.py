@@ -0,0 +1,80 @@
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lab_pipeline import MAX_LAG, ROLL, feature_names
+from src.scoring import score_chunks, sweep_scored
+
+LAG_1 = feature_names(MAX_LAG, ROLL).index("lag_1")
+
+
+class _LastValue:
+    """Stand-in model: predicts the previous hour's value."""
+
+    def predict(self, X):
+        return X[:, LAG_1]
+
+
+def _series(rows: int) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=rows, freq="h")
+    return pd.DataFrame({"timestamp": idx, "demand": np.arange(rows, dtype=float)})
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+def _score(df: pd.DataFrame, size: int = 100):
+    out = io.StringIO()
+    stats = score_chunks(_chunks(df, size), _LastValue(), out, dt_col="timestamp", y_col="demand")
+    return stats, pd.read_csv(io.StringIO(out.getvalue()))
+
+
+def test_hourly_series_scores_across_chunks():
+    stats, scored = _score(_series(500))
+    assert stats["rows"] == 500 and stats["chunks"] == 5 and stats["dropped"] == 0
+    ok = scored["prediction"].notna()
+    assert ok.sum() == stats["scored"] > 0
+    assert (scored.loc[ok, "prediction"] == scored.loc[ok, "actual"] - 1).all()
+
+
+def test_shuffled_rows_are_rejected():
+    df = _series(500).sample(frac=1.0, random_state=0)
+    with pytest.raises(ValueError, match="hourly and in time order"):
+        _score(df)
+
+
+def test_gap_is_rejected():
+    df = _series(500).drop(index=[250])
+    with pytest.raises(ValueError, match="hourly and in time order"):
+        _score(df)
+
+
+def test_gap_at_chunk_boundary_is_rejected():
+    df = _series(500).drop(index=[200])  # the third chunk starts one hour late
+    with pytest.raises(ValueError, match=r"row 201 \(2024-01-09 09:00:00\) follows 2024-01-09 07:00:00"):
+        _score(df)
+
+
+def test_unparseable_timestamps_are_counted():
+    df = _series(500).astype({"timestamp": object})
+    junk = pd.DataFrame({"timestamp": ["not a date"], "demand": [1.0]})
+    df = pd.concat([df.iloc[:250], junk, df.iloc[250:]], ignore_index=True)
+    stats, scored = _score(df)
+    assert stats["rows"] == 501 and stats["dropped"] == 1
+    assert len(scored) == stats["rows"] - stats["dropped"]
+    assert scored["prediction"].notna().sum() == stats["scored"]
+
+
+def test_sweep_removes_only_expired_files(tmp_path):
+    old, new = tmp_path / "lab_scored_old.csv", tmp_path / "lab_scored_new.csv"
+    old.write_text("x")
+    new.write_text("x")
+    stale = time.time() - 7200
+    os.utime(old, (stale, stale))
+    assert sweep_scored(tmp_path, ttl_s=3600) == 1
+    assert not old.exists() and new.exists()